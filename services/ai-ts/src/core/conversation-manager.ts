@@ -197,7 +197,11 @@ export class ConversationManager {
       await this.storeConversation(conversation);
 
       logConversationInteraction(conversationId, 'query', query.length);
-      logConversationInteraction(conversationId, 'response', JSON.stringify(response).length);
+      // message_length is the size of the whole serialized response; only pay
+      // for that serialization when the record will actually be emitted
+      if (logger.isLevelEnabled('info')) {
+        logConversationInteraction(conversationId, 'response', JSON.stringify(response).length);
+      }
     } catch (error) {
       logError(error, 'ConversationManager.saveInteraction');
       throw new Error('Failed to save conversation interaction');
@@ -236,8 +240,6 @@ export class ConversationManager {
       }
 
       const messages = conversation.messages;
-      const queries = messages.filter((m) => m.type === 'query');
-      const responses = messages.filter((m) => m.type === 'response');
 
       // Calculate duration
       const startTime = new Date(conversation.startTime);
@@ -247,42 +249,47 @@ export class ConversationManager {
       // Extract main topics from tags
       const mainTopics = [...new Set(conversation.tags)];
 
-      // Extract concerns from query messages
-      const concerns = queries.map((q) => q.content.substring(0, 100)).slice(0, 5);
-
-      // Extract recommendations from response messages
+      // Single pass over the messages: concerns come from queries, while
+      // recommendations and the follow-up flag come from each response,
+      // whose JSON content is parsed only once
+      const concerns: string[] = [];
       const recommendations: string[] = [];
-      for (const response of responses) {
-        try {
-          const responseData = JSON.parse(response.content);
-          if (responseData.primary) {
-            recommendations.push(responseData.primary);
+      let followUpNeeded = false;
+      for (const message of messages) {
+        if (message.type === 'query') {
+          if (concerns.length < 5) {
+            concerns.push(message.content.substring(0, 100));
           }
-        } catch {
-          // Skip invalid JSON
+          continue;
+        }
+
+        if (message.type !== 'response') {
+          continue;
         }
-      }
 
-      // Determine if follow-up is needed
-      const followUpNeeded = responses.some((r) => {
         try {
-          const responseData = JSON.parse(r.content);
-          return (
+          const responseData = JSON.parse(message.content);
+          if (responseData.primary && recommendations.length < 5) {
+            recommendations.push(responseData.primary);
+          }
+          if (
             responseData.followUpRequired ||
             responseData.urgency === 'high' ||
             responseData.urgency === 'emergency'
-          );
+          ) {
+            followUpNeeded = true;
+          }
         } catch {
-          return false;
+          // Skip invalid JSON
         }
-      });
+      }
 
       return {
         totalMessages: messages.length,
         duration,
         mainTopics: mainTopics.slice(0, 5),
         concerns,
-        recommendations: recommendations.slice(0, 5),
+        recommendations,
         followUpNeeded,
       };
     } catch (error) {
@@ -328,8 +335,10 @@ export class ConversationManager {
         const pattern = 'conversation:*';
         const keys = await this.redis.keys(pattern);
 
-        for (const key of keys) {
-          const data = await this.redis.get(key);
+        // Fetch every match in one MGET round trip instead of one GET per key
+        const values = keys.length > 0 ? await this.redis.mGet(keys) : [];
+
+        for (const data of values) {
           if (data) {
             const conversation = JSON.parse(data);
             if (conversation.patientId === patientId) {
@@ -346,10 +355,12 @@ export class ConversationManager {
         }
       }
 
-      // Sort by last activity (most recent first)
-      conversations.sort(
-        (a, b) => new Date(b.lastActivity).getTime() - new Date(a.lastActivity).getTime()
+      // Sort by last activity (most recent first). Parse each timestamp once up
+      // front; the comparator would otherwise re-parse both sides per comparison.
+      const activityTimes = new Map<ConversationContext, number>(
+        conversations.map((conversation) => [conversation, Date.parse(conversation.lastActivity)])
       );
+      conversations.sort((a, b) => activityTimes.get(b)! - activityTimes.get(a)!);
 
       return conversations;
     } catch (error) {
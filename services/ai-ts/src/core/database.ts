@@ -115,10 +115,12 @@ export class DatabaseService {
       const result = await this.db.query(text, params);
       const duration = Date.now() - start;
 
-      logger.debug(`Executed query in ${duration}ms`, {
-        query: text.substring(0, 100),
-        rowCount: (result as any)?.rowCount ?? (result as any)?.rows?.length ?? 0,
-      });
+      if (logger.isLevelEnabled('debug')) {
+        logger.debug(`Executed query in ${duration}ms`, {
+          query: text.substring(0, 100),
+          rowCount: (result as any)?.rowCount ?? (result as any)?.rows?.length ?? 0,
+        });
+      }
 
       return result;
     } catch (error) {
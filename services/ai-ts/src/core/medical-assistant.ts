@@ -81,6 +81,15 @@ export interface TreatmentSuggestion {
   monitoring: string[];
 }
 
+// Condition-specific diagnostic tests, keyed by a keyword in the condition name.
+// All keywords are found in a single case-insensitive scan of the name.
+const CONDITION_TESTS: Record<string, string[]> = {
+  heart: ['ECG', 'Echocardiogram'],
+  infection: ['Blood Culture', 'C-Reactive Protein']
+};
+
+const CONDITION_TEST_PATTERN = new RegExp(Object.keys(CONDITION_TESTS).join('|'), 'gi');
+
 /**
  * Core Medical AI Assistant
  * Coordinates all components to provide intelligent medical assistance
@@ -233,12 +242,14 @@ export class MedicalAssistant {
         conditions: relatedConditions
       });
 
-      // Add recommended tests and red flags
+      // Add recommended tests and red flags. Red flags depend only on the
+      // symptoms, so they are identified once and shared by every suggestion.
+      const redFlags = await this.identifyRedFlags(symptomEntities, patientInfo);
       const enhancedSuggestions = await Promise.all(
         diagnosticSuggestions.map(async (suggestion) => ({
           ...suggestion,
           recommendedTests: await this.recommendDiagnosticTests(suggestion),
-          redFlags: await this.identifyRedFlags(symptomEntities, patientInfo)
+          redFlags: [...redFlags]
         }))
       );
 
@@ -348,12 +359,12 @@ export class MedicalAssistant {
     ];
 
     // Add condition-specific tests
-    if (suggestion.condition.toLowerCase().includes('heart')) {
-      basicTests.push('ECG', 'Echocardiogram');
-    }
-    
-    if (suggestion.condition.toLowerCase().includes('infection')) {
-      basicTests.push('Blood Culture', 'C-Reactive Protein');
+    const matches = suggestion.condition.matchAll(CONDITION_TEST_PATTERN);
+    const keywords = new Set(Array.from(matches, (match) => match[0].toLowerCase()));
+    for (const [keyword, tests] of Object.entries(CONDITION_TESTS)) {
+      if (keywords.has(keyword)) {
+        basicTests.push(...tests);
+      }
     }
 
     return basicTests;
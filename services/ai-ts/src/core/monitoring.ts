@@ -32,6 +32,22 @@ export interface AIMetrics {
   modelLoadTime: number;
 }
 
+/**
+ * Average of a timing window and the per-minute count, in a single pass
+ */
+function summarizeTimings(times: number[], now: number): { average: number; perMinute: number } {
+  let sum = 0;
+  let perMinute = 0;
+  for (const time of times) {
+    sum += time;
+    if (now - time < 60000) {
+      perMinute++;
+    }
+  }
+
+  return { average: times.length > 0 ? sum / times.length : 0, perMinute };
+}
+
 /**
  * Monitoring Service
  * Provides health checks, metrics, and system monitoring
@@ -212,15 +228,12 @@ export class MonitoringService {
       // Uptime
       this.systemMetrics.uptime = process.uptime();
 
-      // Average response time
+      // Average response time and requests per minute (approximate)
+      const requests = summarizeTimings(this.requestTimes, Date.now());
       if (this.requestTimes.length > 0) {
-        this.systemMetrics.averageResponseTime =
-          this.requestTimes.reduce((sum, time) => sum + time, 0) / this.requestTimes.length;
+        this.systemMetrics.averageResponseTime = requests.average;
       }
-
-      // Requests per minute (approximate)
-      const recentRequests = this.requestTimes.filter((time) => Date.now() - time < 60000).length;
-      this.systemMetrics.requestsPerMinute = recentRequests;
+      this.systemMetrics.requestsPerMinute = requests.perMinute;
     } catch (error) {
       logError(error, 'MonitoringService.updateSystemMetrics');
     }
@@ -231,16 +244,12 @@ export class MonitoringService {
    */
   private updateAIMetrics(): void {
     try {
-      // Average processing time
+      // Average processing time and queries per minute (approximate)
+      const queries = summarizeTimings(this.queryTimes, Date.now());
       if (this.queryTimes.length > 0) {
-        this.aiMetrics.averageProcessingTime =
-          this.queryTimes.reduce((sum, time) => sum + time, 0) / this.queryTimes.length;
+        this.aiMetrics.averageProcessingTime = queries.average;
       }
-
-      // Queries per minute (approximate)
-      const now = Date.now();
-      const recentQueries = this.queryTimes.filter((time) => now - time < 60000).length;
-      this.aiMetrics.queriesPerMinute = recentQueries;
+      this.aiMetrics.queriesPerMinute = queries.perMinute;
 
       // Error rate
       if (this.totalRequests > 0) {
@@ -56,12 +56,14 @@ export const logError = (error: Error | unknown, context?: string) => {
   }
 };
 
-// Performance logging utilities
+// Performance logging utilities. The helpers below check the level first so
+// the record object is only built when it will actually be emitted.
 export const logPerformance = (
   operation: string,
   duration: number,
   metadata?: Record<string, any>
 ) => {
+  if (!logger.isLevelEnabled('info')) return;
   logger.info(
     {
       operation,
@@ -75,6 +77,7 @@ export const logPerformance = (
 
 // Medical operation logging
 export const logMedicalQuery = (query: string, patientId?: string, confidence?: number) => {
+  if (!logger.isLevelEnabled('info')) return;
   logger.info(
     {
       type: 'medical_query',
@@ -93,6 +96,7 @@ export const logDiagnosticSuggestion = (
   suggestions: any[],
   confidence: number
 ) => {
+  if (!logger.isLevelEnabled('info')) return;
   logger.info(
     {
       type: 'diagnostic_suggestion',
@@ -111,6 +115,7 @@ export const logTreatmentRecommendation = (
   treatments: any[],
   severity: string
 ) => {
+  if (!logger.isLevelEnabled('info')) return;
   logger.info(
     {
       type: 'treatment_recommendation',
@@ -129,6 +134,7 @@ export const logConversationInteraction = (
   messageType: 'query' | 'response',
   length: number
 ) => {
+  if (!logger.isLevelEnabled('info')) return;
   logger.info(
     {
       type: 'conversation_interaction',
@@ -143,6 +149,7 @@ export const logConversationInteraction = (
 
 // Knowledge base logging
 export const logKnowledgeBaseQuery = (query: string, resultsFound: number, searchTime: number) => {
+  if (!logger.isLevelEnabled('info')) return;
   logger.info(
     {
       type: 'knowledge_base_query',
@@ -157,6 +164,7 @@ export const logKnowledgeBaseQuery = (query: string, resultsFound: number, searc
 
 // Model loading logging
 export const logModelLoading = (modelName: string, loadTime: number, success: boolean) => {
+  if (!logger.isLevelEnabled('info')) return;
   logger.info(
     {
       type: 'model_loading',
@@ -171,6 +179,7 @@ export const logModelLoading = (modelName: string, loadTime: number, success: bo
 
 // Security logging
 export const logSecurityEvent = (event: string, details: Record<string, any>) => {
+  if (!logger.isLevelEnabled('warn')) return;
   logger.warn(
     {
       type: 'security_event',
@@ -184,6 +193,7 @@ export const logSecurityEvent = (event: string, details: Record<string, any>) =>
 
 // Rate limit logging
 export const logRateLimit = (clientId: string, endpoint: string, attempts: number) => {
+  if (!logger.isLevelEnabled('warn')) return;
   logger.warn(
     {
       type: 'rate_limit',
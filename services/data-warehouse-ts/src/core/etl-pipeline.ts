@@ -16,6 +16,12 @@ export interface ETLJob {
   errors: string[];
 }
 
+export interface ETLRunOutcome {
+  status: 'completed' | 'failed' | 'idle';
+  jobId?: string;
+  endTime?: Date;
+}
+
 export interface DataSource {
   name: string;
   type: 'api' | 'database' | 'file';
@@ -24,9 +30,41 @@ export interface DataSource {
   filePath?: string;
 }
 
+// Finished jobs beyond this many are dropped, oldest first
+const MAX_RETAINED_JOBS = 500;
+
+// Job IDs sort by creation time: a fixed-width base36 clock followed by a
+// fixed-width sequence that orders jobs created within the same millisecond.
+// Once a millisecond's sequence is used up the ID moves on to the next
+// millisecond instead of wrapping, so IDs never repeat or go backwards.
+const JOB_SEQUENCE_MAX = 0xffff;
+let lastJobMs = 0;
+let jobSequence = 0;
+
+export function nextJobId(): string {
+  const now = Date.now();
+  if (now > lastJobMs) {
+    lastJobMs = now;
+    jobSequence = 0;
+  } else if (jobSequence < JOB_SEQUENCE_MAX) {
+    jobSequence++;
+  } else {
+    lastJobMs++;
+    jobSequence = 0;
+  }
+
+  const clock = lastJobMs.toString(36).padStart(9, '0');
+  return `job_${clock}_${jobSequence.toString(36).padStart(4, '0')}`;
+}
+
 export class ETLPipeline {
+  // Whether the pipeline service is started (initialize/stop), not whether a
+  // run is in flight; see isRunInProgress() for that
   private running = false;
+  private currentRun: Promise<void> | null = null;
   private jobs: Map<string, ETLJob> = new Map();
+  // Most recently finished job, kept so status checks don't scan every job
+  private lastFinishedJob: ETLJob | null = null;
   private dataSources: Map<string, DataSource> = new Map();
 
   constructor(
@@ -40,25 +78,64 @@ export class ETLPipeline {
     return this.running;
   }
 
-  async run(): Promise<void> {
-    if (this.running) {
-      logger.warn('ETL Pipeline is already running');
-      return;
+  isRunInProgress(): boolean {
+    return this.currentRun !== null;
+  }
+
+  run(): Promise<void> {
+    // Repeated triggers get the in-flight run's promise instead of starting a new one
+    if (!this.currentRun) {
+      this.currentRun = this.execute().finally(() => {
+        this.currentRun = null;
+      });
+    }
+
+    return this.currentRun;
+  }
+
+  /**
+   * Settle with the outcome of the in-flight run, or of the last finished run
+   * when none is in flight ('idle' if nothing has run yet), so callers can wait
+   * for completion instead of polling.
+   */
+  async waitForRun(): Promise<ETLRunOutcome> {
+    await this.currentRun?.catch(() => undefined);
+
+    const job = this.lastFinishedJob;
+    if (!job) {
+      return { status: 'idle' };
     }
 
+    return {
+      status: job.status === 'failed' ? 'failed' : 'completed',
+      jobId: job.id,
+      endTime: job.endTime,
+    };
+  }
+
+  private async execute(): Promise<void> {
+    // Each run is recorded as a job so its outcome outlives the run itself
+    const jobId = await this.createJob('pipeline-run', 'all-sources', 'warehouse');
+    const job = this.jobs.get(jobId)!;
+    job.status = 'running';
+    job.startTime = new Date();
+
     try {
-      this.running = true;
       logger.info('Starting ETL Pipeline...');
 
       // Mock ETL execution
       await this.mockETLExecution();
 
+      job.status = 'completed';
       logger.info('ETL Pipeline completed successfully');
     } catch (error) {
+      job.status = 'failed';
+      job.errors.push(String(error));
       logger.error('ETL Pipeline failed:', error);
       throw error;
     } finally {
-      this.running = false;
+      job.endTime = new Date();
+      this.lastFinishedJob = job;
     }
   }
 
@@ -81,7 +158,7 @@ export class ETLPipeline {
   }
 
   async createJob(name: string, source: string, target: string): Promise<string> {
-    const jobId = `job_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+    const jobId = nextJobId();
 
     const job: ETLJob = {
       id: jobId,
@@ -94,6 +171,7 @@ export class ETLPipeline {
     };
 
     this.jobs.set(jobId, job);
+    this.pruneFinishedJobs();
     logger.info(`ETL job created: ${name}`, { jobId, source, target });
 
     return jobId;
@@ -124,6 +202,7 @@ export class ETLPipeline {
       job.recordsProcessed = Array.isArray(transformedData) ? transformedData.length : 1;
       job.status = 'completed';
       job.endTime = new Date();
+      this.lastFinishedJob = job;
 
       logger.info(`ETL job completed: ${job.name}`, {
         jobId,
@@ -136,12 +215,25 @@ export class ETLPipeline {
       job.status = 'failed';
       job.endTime = new Date();
       job.errors.push(String(error));
+      this.lastFinishedJob = job;
 
       logger.error(`ETL job failed: ${job.name}`, { jobId, error });
       return false;
     }
   }
 
+  private pruneFinishedJobs(): void {
+    // Maps iterate in insertion order, so the first finished jobs are the oldest
+    for (const [jobId, job] of this.jobs) {
+      if (this.jobs.size <= MAX_RETAINED_JOBS) {
+        return;
+      }
+      if (job.status === 'completed' || job.status === 'failed') {
+        this.jobs.delete(jobId);
+      }
+    }
+  }
+
   async extractData(sourceName: string): Promise<any[]> {
     const source = this.dataSources.get(sourceName);
     if (!source) {
@@ -165,10 +257,12 @@ export class ETLPipeline {
   async transformData(data: any[]): Promise<any[]> {
     logger.debug(`Transforming ${data.length} records`);
 
-    // Basic transformation - in production, this would be more sophisticated
+    // Basic transformation - in production, this would be more sophisticated.
+    // Every record in a run shares one processing timestamp.
+    const processedAt = new Date();
     return data.map((record) => ({
       ...record,
-      processed_at: new Date(),
+      processed_at: processedAt,
       etl_version: '1.0.0',
     }));
   }
@@ -176,10 +270,7 @@ export class ETLPipeline {
   async loadData(data: any[], targetName: string): Promise<void> {
     logger.debug(`Loading ${data.length} records to: ${targetName}`);
 
-    // Mock load operation
-    for (const record of data) {
-      await this.databaseService.saveRecord(targetName, record);
-    }
+    await this.databaseService.saveRecords(targetName, data);
   }
 
   private async extractFromAPI(source: DataSource): Promise<any[]> {
@@ -257,12 +348,9 @@ export class ETLPipeline {
   }
 
   async getLastRunInfo(): Promise<{ jobId?: string; endTime?: Date; status?: string }> {
-    const jobs = this.getAllJobs();
-    if (jobs.length === 0) return {};
-
-    const lastJob = jobs.reduce((latest, job) =>
-      !latest.endTime || (job.endTime && job.endTime > latest.endTime) ? job : latest
-    );
+    // Until a job finishes, report the most recently created one
+    const lastJob = this.lastFinishedJob ?? this.getAllJobs().at(-1);
+    if (!lastJob) return {};
 
     return {
       jobId: lastJob.id,
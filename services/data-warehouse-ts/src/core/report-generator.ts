@@ -2,6 +2,7 @@
  * Report Generator - Business intelligence reports and dashboards
  */
 
+import { randomUUID } from 'crypto';
 import { logger } from '../utils/logger.js';
 
 export interface Report {
@@ -53,7 +54,8 @@ export class ReportGenerator {
       throw new Error(`Report template not found: ${templateId}`);
     }
 
-    const reportId = `report_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+    // randomUUID draws from a pooled entropy buffer rather than the OS per call
+    const reportId = `report_${randomUUID()}`;
 
     const report: Report = {
       id: reportId,
@@ -19,6 +19,62 @@ import { SchedulerService } from './services/scheduler.service.js';
 import { CacheService } from './services/cache.service.js';
 import { DatabaseService } from './services/database.service.js';
 
+// The status endpoint is polled by dashboards; a response schema lets Fastify
+// compile a dedicated serializer instead of running JSON.stringify each time.
+const statusResponseSchema = {
+  type: 'object',
+  properties: {
+    timestamp: { type: 'string', format: 'date-time' },
+    etl: {
+      type: 'object',
+      properties: {
+        isRunning: { type: 'boolean' },
+        lastRun: {
+          type: 'object',
+          properties: {
+            jobId: { type: 'string' },
+            endTime: { type: 'string', format: 'date-time' },
+            status: { type: 'string' },
+          },
+        },
+        nextRun: {
+          type: 'object',
+          properties: {
+            scheduled: { type: 'string', format: 'date-time' },
+          },
+        },
+      },
+    },
+    analytics: {
+      type: 'object',
+      properties: {
+        cacheSize: { type: 'integer' },
+        lastAnalysis: {
+          type: 'object',
+          properties: {
+            timestamp: { type: 'string', format: 'date-time' },
+            queryCount: { type: 'integer' },
+          },
+        },
+      },
+    },
+    reports: {
+      type: 'object',
+      properties: {
+        generated: { type: 'integer' },
+        scheduled: { type: 'integer' },
+      },
+    },
+    storage: {
+      type: 'object',
+      properties: {
+        totalRecords: { type: 'integer' },
+        storageSize: { type: 'string' },
+      },
+    },
+  },
+};
+
 // Global services
 let etlPipeline: ETLPipeline;
 let analyticsEngine: AnalyticsEngine;
@@ -112,30 +168,34 @@ export async function createApp(): Promise<FastifyInstance> {
   });
 
   // Data warehouse status endpoint
-  fastify.get('/status', async (request, reply) => {
-    const status = {
-      timestamp: new Date(),
-      etl: {
-        isRunning: etlPipeline.isRunning(),
-        lastRun: await etlPipeline.getLastRunInfo(),
-        nextRun: await etlPipeline.getNextRunInfo(),
-      },
-      analytics: {
-        cacheSize: await analyticsEngine.getCacheSize(),
-        lastAnalysis: await analyticsEngine.getLastAnalysisInfo(),
-      },
-      reports: {
-        generated: await reportGenerator.getGeneratedReportsCount(),
-        scheduled: await reportGenerator.getScheduledReportsCount(),
-      },
-      storage: {
-        totalRecords: await databaseService.getTotalRecords(),
-        storageSize: await databaseService.getStorageSize(),
-      },
-    };
+  fastify.get(
+    '/status',
+    { schema: { response: { 200: statusResponseSchema } } },
+    async (request, reply) => {
+      const status = {
+        timestamp: new Date(),
+        etl: {
+          isRunning: etlPipeline.isRunning(),
+          lastRun: await etlPipeline.getLastRunInfo(),
+          nextRun: await etlPipeline.getNextRunInfo(),
+        },
+        analytics: {
+          cacheSize: await analyticsEngine.getCacheSize(),
+          lastAnalysis: await analyticsEngine.getLastAnalysisInfo(),
+        },
+        reports: {
+          generated: await reportGenerator.getGeneratedReportsCount(),
+          scheduled: await reportGenerator.getScheduledReportsCount(),
+        },
+        storage: {
+          totalRecords: await databaseService.getTotalRecords(),
+          storageSize: await databaseService.getStorageSize(),
+        },
+      };
 
-    return reply.send(status);
-  });
+      return reply.send(status);
+    }
+  );
 
   // Setup data warehouse API routes
   await setupRoutes(fastify);
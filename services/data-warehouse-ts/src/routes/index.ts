@@ -4,6 +4,10 @@
 
 import type { FastifyInstance } from 'fastify';
 import { logger } from '../utils/logger';
+import type { ETLRunOutcome } from '../core/etl-pipeline';
+
+// Comment lines sent on open event streams so idle proxies keep the connection
+const SSE_HEARTBEAT_MS = 15000;
 
 export async function setupRoutes(fastify: FastifyInstance): Promise<void> {
   logger.info('Setting up data warehouse routes...');
@@ -12,5 +16,44 @@ export async function setupRoutes(fastify: FastifyInstance): Promise<void> {
   // Additional API routes for data warehouse can be registered here.
   // Note: health/status endpoints are provided by the main application in src/index.ts
 
+  // ETL endpoints
+  await fastify.register(
+    async (api) => {
+      api.post('/etl/run', async (request, reply) => {
+        // Run in the background; retries while a run is in flight join it.
+        // Failures are logged by the pipeline itself.
+        fastify.etlPipeline.run().catch(() => undefined);
+        return reply.status(202).send({ success: true, message: 'ETL pipeline started' });
+      });
+
+      // Server-sent event with the outcome of the in-flight run, or of the last
+      // finished one, so clients that triggered a run don't poll /status
+      api.get('/etl/events', (request, reply) => {
+        reply.hijack();
+        const stream = reply.raw;
+        // Hijacking skips Fastify's reply, so carry over the headers plugins
+        // such as CORS already set on it
+        stream.writeHead(200, {
+          ...reply.getHeaders(),
+          'Content-Type': 'text/event-stream',
+          'Cache-Control': 'no-cache',
+          Connection: 'keep-alive',
+        });
+
+        const heartbeat = setInterval(() => stream.write(': heartbeat\n\n'), SSE_HEARTBEAT_MS);
+        // Fires on normal completion and when the client disconnects early
+        stream.on('close', () => clearInterval(heartbeat));
+
+        fastify.etlPipeline.waitForRun().then((outcome: ETLRunOutcome) => {
+          clearInterval(heartbeat);
+          if (!stream.destroyed && !stream.writableEnded) {
+            stream.end(`event: result\ndata: ${JSON.stringify(outcome)}\n\n`);
+          }
+        });
+      });
+    },
+    { prefix: '/api/v1' }
+  );
+
   logger.info('Data warehouse routes configured');
 }
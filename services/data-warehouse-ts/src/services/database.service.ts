@@ -4,6 +4,15 @@
 
 import { logger } from '../utils/logger';
 
+// Record ids stay millisecond timestamps, bumped past the previous id when
+// several records are written in the same millisecond so none collide
+let lastRecordId = 0;
+
+function nextRecordId(): number {
+  lastRecordId = Math.max(Date.now(), lastRecordId + 1);
+  return lastRecordId;
+}
+
 export class DatabaseService {
   private isConnected = false;
   private mockData: Map<string, any[]> = new Map();
@@ -39,11 +48,28 @@ export class DatabaseService {
     }
 
     const records = this.mockData.get(table)!;
-    records.push({ ...record, id: Date.now() });
+    records.push({ ...record, id: nextRecordId() });
 
     logger.debug(`Record saved to ${table}`);
   }
 
+  async saveRecords(table: string, records: any[]): Promise<void> {
+    if (records.length === 0) return;
+
+    if (!this.mockData.has(table)) {
+      this.mockData.set(table, []);
+    }
+
+    // Single batched write (one transaction / multi-row INSERT against a real
+    // database) instead of one round-trip per record.
+    const stored = this.mockData.get(table)!;
+    for (const record of records) {
+      stored.push({ ...record, id: nextRecordId() });
+    }
+
+    logger.debug(`${records.length} records saved to ${table}`);
+  }
+
   async getTotalRecords(): Promise<number> {
     let total = 0;
     for (const records of this.mockData.values()) {
@@ -19,4 +19,18 @@ describe('Data Warehouse DatabaseService (mock)', () => {
     expect(total).toBeGreaterThanOrEqual(2);
     await db.close();
   });
+
+  it('gives every record in a batch its own id', async () => {
+    const db = new DatabaseService();
+    await db.connect();
+    await db.saveRecords('batch_table', [{ name: 'alice' }, { name: 'bob' }, { name: 'carol' }]);
+    await db.saveRecords('batch_table', [{ name: 'dave' }]);
+
+    const ids = ((db as any).mockData.get('batch_table') as Array<{ id: number }>).map(
+      (record) => record.id
+    );
+    expect(new Set(ids).size).toBe(4);
+    expect([...ids].sort((a, b) => a - b)).toEqual(ids);
+    await db.close();
+  });
 });
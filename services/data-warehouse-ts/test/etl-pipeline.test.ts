@@ -0,0 +1,73 @@
+import { afterEach, describe, it, expect, vi } from 'vitest';
+import { ETLPipeline } from '../src/core/etl-pipeline';
+
+// Fresh module state (clock and sequence) for tests that drive the generator
+async function loadNextJobId() {
+  vi.resetModules();
+  const { nextJobId } = await import('../src/core/etl-pipeline');
+  return nextJobId;
+}
+
+async function createJobs(pipeline: ETLPipeline, count: number): Promise<string[]> {
+  const ids: string[] = [];
+  for (let i = 0; i < count; i++) {
+    ids.push(await pipeline.createJob(`job-${i}`, 'fhir-patients', 'warehouse'));
+  }
+  return ids;
+}
+
+describe('Data Warehouse - ETL job IDs', () => {
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('gives jobs created in the same millisecond unique, creation-ordered IDs', async () => {
+    vi.useFakeTimers({ toFake: ['Date'] });
+    vi.setSystemTime(new Date('2026-03-01T12:00:00.000Z'));
+    const pipeline = new ETLPipeline({}, {});
+
+    const ids = await createJobs(pipeline, 50);
+
+    expect(new Set(ids).size).toBe(ids.length);
+    expect([...ids].sort()).toEqual(ids);
+  });
+
+  it('orders IDs by creation time across milliseconds', async () => {
+    vi.useFakeTimers({ toFake: ['Date'] });
+    vi.setSystemTime(new Date('2026-03-01T12:00:00.000Z'));
+    const pipeline = new ETLPipeline({}, {});
+
+    const earlier = await createJobs(pipeline, 3);
+    vi.setSystemTime(new Date('2026-03-01T12:00:00.001Z'));
+    const later = await createJobs(pipeline, 3);
+
+    const ids = [...earlier, ...later];
+    expect([...ids].sort()).toEqual(ids);
+    expect(ids.every((id) => /^job_[0-9a-z]{9}_[0-9a-z]{4}$/.test(id))).toBe(true);
+  });
+
+  it('moves to the next millisecond once a millisecond runs out of sequence numbers', async () => {
+    vi.useFakeTimers({ toFake: ['Date'] });
+    vi.setSystemTime(new Date('2026-03-01T12:00:00.000Z'));
+    const nextJobId = await loadNextJobId();
+
+    const ids = Array.from({ length: 0x10001 }, () => nextJobId());
+
+    expect(new Set(ids).size).toBe(ids.length);
+    expect(ids.at(-2)!.endsWith('_1ekf')).toBe(true);
+    expect(ids.at(-1)!.endsWith('_0000')).toBe(true);
+    expect(ids.at(-1)! > ids.at(-2)!).toBe(true);
+  });
+
+  it('keeps IDs ordered when the wall clock steps back', async () => {
+    vi.useFakeTimers({ toFake: ['Date'] });
+    vi.setSystemTime(new Date('2026-03-01T12:00:00.000Z'));
+    const nextJobId = await loadNextJobId();
+
+    const before = nextJobId();
+    vi.setSystemTime(new Date('2026-03-01T11:59:59.000Z'));
+    const after = nextJobId();
+
+    expect(after > before).toBe(true);
+  });
+});
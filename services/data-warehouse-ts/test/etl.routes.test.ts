@@ -0,0 +1,110 @@
+import { beforeAll, afterAll, describe, it, expect, vi } from 'vitest';
+import http from 'node:http';
+import { createApp } from '../src/index';
+
+let app: Awaited<ReturnType<typeof createApp>>;
+
+beforeAll(async () => {
+  app = await createApp();
+});
+
+afterAll(async () => {
+  if (app) await app.close();
+});
+
+function parseEvent(payload: string): { event: string; data: any } {
+  const event = /^event: (.+)$/m.exec(payload)?.[1] ?? '';
+  const data = /^data: (.+)$/m.exec(payload)?.[1] ?? 'null';
+  return { event, data: JSON.parse(data) };
+}
+
+describe('Data Warehouse - ETL routes', () => {
+  it('GET /api/v1/etl/events reports idle before any run', async () => {
+    const res = await app.inject({ method: 'GET', url: '/api/v1/etl/events' });
+    expect(res.statusCode).toBe(200);
+    expect(res.headers['content-type']).toBe('text/event-stream');
+    expect(parseEvent(res.payload)).toEqual({ event: 'result', data: { status: 'idle' } });
+  });
+
+  it('GET /api/v1/etl/events keeps the CORS headers for allowed origins', async () => {
+    const res = await app.inject({
+      method: 'GET',
+      url: '/api/v1/etl/events',
+      headers: { origin: 'http://localhost:3000' },
+    });
+    expect(res.statusCode).toBe(200);
+    expect(res.headers['content-type']).toBe('text/event-stream');
+    expect(res.headers['access-control-allow-origin']).toBe('http://localhost:3000');
+    expect(res.headers['access-control-allow-credentials']).toBe('true');
+  });
+
+  it('POST /api/v1/etl/run answers 202 and completes the run in the background', async () => {
+    const res = await app.inject({ method: 'POST', url: '/api/v1/etl/run' });
+    expect(res.statusCode).toBe(202);
+    expect(JSON.parse(res.payload)).toEqual({ success: true, message: 'ETL pipeline started' });
+
+    // The response returns before the run finishes
+    expect(app.etlPipeline.isRunInProgress()).toBe(true);
+    await app.etlPipeline.run();
+    expect(app.etlPipeline.isRunInProgress()).toBe(false);
+    expect(app.etlPipeline.isRunning()).toBe(true);
+  });
+
+  it('joins a run that is already in flight', async () => {
+    const first = await app.inject({ method: 'POST', url: '/api/v1/etl/run' });
+    const inFlight = app.etlPipeline.run();
+    const second = await app.inject({ method: 'POST', url: '/api/v1/etl/run' });
+
+    expect(first.statusCode).toBe(202);
+    expect(second.statusCode).toBe(202);
+    expect(app.etlPipeline.run()).toBe(inFlight);
+    await inFlight;
+  });
+
+  it('GET /api/v1/etl/events waits for the in-flight run and sends its outcome', async () => {
+    await app.inject({ method: 'POST', url: '/api/v1/etl/run' });
+    expect(app.etlPipeline.isRunInProgress()).toBe(true);
+
+    const res = await app.inject({ method: 'GET', url: '/api/v1/etl/events' });
+    const { event, data } = parseEvent(res.payload);
+    expect(event).toBe('result');
+    expect(data.status).toBe('completed');
+    expect(data.jobId).toMatch(/^job_/);
+    expect(app.etlPipeline.isRunInProgress()).toBe(false);
+  });
+
+  it('GET /api/v1/etl/events sends the last outcome to clients that connect after a run', async () => {
+    await app.etlPipeline.run();
+    const lastRun = await app.etlPipeline.getLastRunInfo();
+
+    const res = await app.inject({ method: 'GET', url: '/api/v1/etl/events' });
+    const { data } = parseEvent(res.payload);
+    expect(data.status).toBe('completed');
+    expect(data.jobId).toBe(lastRun.jobId);
+  });
+
+  it('stops the heartbeat when a client disconnects before the run settles', async () => {
+    const address = await app.listen({ port: 0, host: '127.0.0.1' });
+    const clearIntervalSpy = vi.spyOn(globalThis, 'clearInterval');
+
+    await app.inject({ method: 'POST', url: '/api/v1/etl/run' });
+    await new Promise<void>((resolve, reject) => {
+      const req = http.get(`${address}/api/v1/etl/events`, (res) => {
+        expect(res.statusCode).toBe(200);
+        res.on('close', () => resolve());
+        req.destroy();
+      });
+      req.on('error', (error: NodeJS.ErrnoException) => {
+        if (error.code !== 'ECONNRESET') reject(error);
+      });
+    });
+
+    // The server notices the closed socket and drops the heartbeat timer
+    await vi.waitFor(() => expect(clearIntervalSpy).toHaveBeenCalled());
+    expect(app.etlPipeline.isRunInProgress()).toBe(true);
+
+    // The run still settles cleanly with nobody listening
+    await expect(app.etlPipeline.run()).resolves.toBeUndefined();
+    clearIntervalSpy.mockRestore();
+  });
+});
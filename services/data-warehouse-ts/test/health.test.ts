@@ -29,4 +29,17 @@ describe('Data Warehouse - health and status', () => {
     expect(body).toHaveProperty('reports');
     expect(body).toHaveProperty('storage');
   });
+
+  it('GET /status keeps nested fields through the response schema', async () => {
+    const res = await app.inject({ method: 'GET', url: '/status' });
+    const body = JSON.parse(res.payload);
+    expect(typeof body.timestamp).toBe('string');
+    expect(typeof body.etl.isRunning).toBe('boolean');
+    expect(typeof body.etl.nextRun.scheduled).toBe('string');
+    expect(typeof body.analytics.cacheSize).toBe('number');
+    expect(typeof body.analytics.lastAnalysis.queryCount).toBe('number');
+    expect(typeof body.reports.generated).toBe('number');
+    expect(typeof body.storage.totalRecords).toBe('number');
+    expect(typeof body.storage.storageSize).toBe('string');
+  });
 });
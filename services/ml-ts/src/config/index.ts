@@ -8,13 +8,17 @@ interface ServerConfig {
   logLevel: string;
 }
 
-interface DatabaseConfig {
+export interface DatabaseConfig {
   host: string;
   port: number;
   database: string;
   username: string;
   password: string;
   ssl: boolean;
+  poolSize: number;
+  idleTimeout: number;
+  maxLifetime: number;
+  connectTimeout: number;
 }
 
 interface CorsConfig {
@@ -35,6 +39,29 @@ interface Config {
   ml: MLConfig;
 }
 
+// Splits a comma-separated env value into trimmed, non-empty items in one pass.
+// A JSON array (`["a","b"]`) is accepted too, so either form works in deploys.
+const LIST_ITEM_RE = /[^\s,]+/g;
+
+export function parseList(value: string | undefined): string[] {
+  if (!value) {
+    return [];
+  }
+
+  if (value.trimStart().startsWith('[')) {
+    try {
+      const items: unknown = JSON.parse(value);
+      if (Array.isArray(items)) {
+        return items.map((item) => String(item).trim()).filter(Boolean);
+      }
+    } catch {
+      // Not valid JSON; fall back to the comma-separated form
+    }
+  }
+
+  return value.match(LIST_ITEM_RE) || [];
+}
+
 // Default configuration
 export const config: Config = {
   server: {
@@ -49,9 +76,16 @@ export const config: Config = {
     username: process.env.DB_USER || 'postgres',
     password: process.env.DB_PASSWORD || 'password',
     ssl: process.env.DB_SSL === 'true',
+    // Pool sizing; timeouts are in seconds, as the postgres client expects
+    poolSize: parseInt(process.env.DB_POOL_SIZE || '20'),
+    idleTimeout: parseInt(process.env.DB_IDLE_TIMEOUT || '30'),
+    maxLifetime: parseInt(process.env.DB_MAX_LIFETIME || '1800'),
+    connectTimeout: parseInt(process.env.DB_CONNECT_TIMEOUT || '30'),
   },
   cors: {
-    allowedOrigins: process.env.CORS_ORIGINS?.split(',') || ['http://localhost:3000'],
+    allowedOrigins: process.env.CORS_ORIGINS
+      ? parseList(process.env.CORS_ORIGINS)
+      : ['http://localhost:3000'],
   },
   ml: {
     modelsPath: process.env.MODELS_PATH || './models',
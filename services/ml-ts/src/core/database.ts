@@ -2,38 +2,90 @@
  * Database Service - Database connection and operations
  */
 
-export class DatabaseService {
-  private config: any;
-  private connection: any = null;
+import postgres from 'postgres';
+import type { DatabaseConfig } from '../config/index.js';
 
-  constructor(config: any) {
+/**
+ * Contract shared by the Postgres service and the in-memory dev fallback, so
+ * the rest of the service never needs to know which one it was given.
+ */
+export interface DatabaseClient {
+  connect(): Promise<void>;
+  close(): Promise<void>;
+  isConnected(): boolean;
+  ping(): Promise<boolean>;
+  query(sql: string, params?: any[]): Promise<any[]>;
+}
+
+export class DatabaseService implements DatabaseClient {
+  private config: DatabaseConfig;
+  private sql: postgres.Sql | null = null;
+
+  constructor(config: DatabaseConfig) {
     this.config = config;
   }
 
   async connect(): Promise<void> {
     console.log('Connecting to database...');
-    // Mock database connection
-    this.connection = { connected: true };
+
+    const sql = postgres({
+      host: this.config.host,
+      port: this.config.port,
+      database: this.config.database,
+      username: this.config.username,
+      password: this.config.password,
+      ssl: this.config.ssl,
+      max: this.config.poolSize,
+      idle_timeout: this.config.idleTimeout,
+      max_lifetime: this.config.maxLifetime,
+      connect_timeout: this.config.connectTimeout,
+    });
+
+    // The client connects lazily; probe once so startup fails fast
+    try {
+      await sql`SELECT 1`;
+    } catch (error) {
+      await sql.end({ timeout: 0 });
+      throw error;
+    }
+
+    this.sql = sql;
     console.log('Database connected successfully');
   }
 
   async close(): Promise<void> {
     console.log('Closing database connection...');
-    this.connection = null;
+    await this.sql?.end({ timeout: 5 });
+    this.sql = null;
     console.log('Database connection closed');
   }
 
   isConnected(): boolean {
-    return this.connection !== null;
+    return this.sql !== null;
+  }
+
+  /**
+   * Connectivity probe for health checks. Runs on the async driver, so a slow
+   * database never stalls other requests on the event loop.
+   */
+  async ping(): Promise<boolean> {
+    if (!this.sql) {
+      return false;
+    }
+
+    try {
+      await this.sql`SELECT 1`;
+      return true;
+    } catch {
+      return false;
+    }
   }
 
   async query(sql: string, params?: any[]): Promise<any[]> {
-    if (!this.isConnected()) {
+    if (!this.sql) {
       throw new Error('Database not connected');
     }
 
-    // Mock query execution
-    console.log(`Executing query: ${sql}`);
-    return [];
+    return await this.sql.unsafe(sql, params);
   }
 }
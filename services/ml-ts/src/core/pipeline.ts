@@ -10,13 +10,57 @@ interface PredictionRequest {
 interface PredictionResult {
   prediction: string;
   confidence: number;
-  factors: string[];
+  factors: readonly string[];
   timestamp: Date;
 }
 
+// Mock outputs per model type, built once instead of on every prediction
+const MOCK_PREDICTIONS: Record<PredictionRequest['modelType'], readonly string[]> = {
+  diagnosis: ['Diabetes Type 2', 'Hypertension', 'Cardiac Arrhythmia'],
+  risk: ['Low Risk', 'Medium Risk', 'High Risk'],
+  outcome: ['Good Prognosis', 'Fair Prognosis', 'Poor Prognosis'],
+};
+
+// Shared by every result, so frozen to keep one caller's edits out of the rest
+const MOCK_FACTORS: readonly string[] = Object.freeze([
+  'Age',
+  'BMI',
+  'Blood Pressure',
+  'Family History',
+]);
+
+// While predictions keep arriving, callers within this window share one model
+// run per type; an idle pipeline flushes on the next event-loop turn instead
+const BATCH_WINDOW_MS = 5;
+
+interface PendingPrediction {
+  request: PredictionRequest;
+  resolve: (result: PredictionResult) => void;
+  reject: (error: unknown) => void;
+}
+
+// Indexes of the requests for each model type, in input order
+function groupByModelType(
+  requests: PredictionRequest[]
+): Map<PredictionRequest['modelType'], number[]> {
+  const groups = new Map<PredictionRequest['modelType'], number[]>();
+  requests.forEach((request, index) => {
+    const indexes = groups.get(request.modelType);
+    if (indexes) {
+      indexes.push(index);
+    } else {
+      groups.set(request.modelType, [index]);
+    }
+  });
+  return groups;
+}
+
 export class MLPipeline {
   private config: any;
   private models: Map<string, any> = new Map();
+  private pendingPredictions: PendingPrediction[] = [];
+  private cancelScheduledFlush: (() => void) | null = null;
+  private lastFlushAt = 0;
 
   constructor(config: any) {
     this.config = config;
@@ -34,33 +78,112 @@ export class MLPipeline {
     console.log('ML Pipeline initialized successfully');
   }
 
-  async predict(request: PredictionRequest): Promise<PredictionResult> {
-    const model = this.models.get(request.modelType);
+  /**
+   * Queue a single prediction. Requests from concurrent callers are collected
+   * until the scheduled flush, or until `batchSize` are waiting, and then run
+   * together so each model executes once per batch instead of once per call.
+   */
+  predict(request: PredictionRequest): Promise<PredictionResult> {
+    return new Promise((resolve, reject) => {
+      this.pendingPredictions.push({ request, resolve, reject });
+
+      if (this.pendingPredictions.length >= this.config.batchSize) {
+        this.flushPredictions();
+      } else if (!this.cancelScheduledFlush) {
+        this.scheduleFlush();
+      }
+    });
+  }
+
+  /**
+   * Predict for many requests in one call. Requests are grouped by model type
+   * so each model runs once over its whole group; results keep input order.
+   */
+  async predictBatch(requests: PredictionRequest[]): Promise<PredictionResult[]> {
+    const results = new Array<PredictionResult>(requests.length);
+    for (const [modelType, indexes] of groupByModelType(requests)) {
+      const outputs = this.runModel(modelType, indexes.map((index) => requests[index].patientData));
+      indexes.forEach((requestIndex, i) => {
+        results[requestIndex] = outputs[i];
+      });
+    }
+
+    return results;
+  }
+
+  // A lone request after a quiet period only waits for the current event-loop
+  // turn, which still gathers callers that arrived together; under sustained
+  // traffic the flush waits BATCH_WINDOW_MS to build larger batches
+  private scheduleFlush(): void {
+    if (Date.now() - this.lastFlushAt >= BATCH_WINDOW_MS) {
+      const immediate = setImmediate(() => this.flushPredictions());
+      this.cancelScheduledFlush = () => clearImmediate(immediate);
+    } else {
+      const timer = setTimeout(() => this.flushPredictions(), BATCH_WINDOW_MS);
+      this.cancelScheduledFlush = () => clearTimeout(timer);
+    }
+  }
+
+  private flushPredictions(): void {
+    this.cancelScheduledFlush?.();
+    this.cancelScheduledFlush = null;
+    this.lastFlushAt = Date.now();
+
+    const batch = this.pendingPredictions;
+    this.pendingPredictions = [];
+
+    const requests = batch.map((pending) => pending.request);
+    for (const [modelType, indexes] of groupByModelType(requests)) {
+      try {
+        const outputs = this.runModel(
+          modelType,
+          indexes.map((index) => requests[index].patientData)
+        );
+        indexes.forEach((requestIndex, i) => batch[requestIndex].resolve(outputs[i]));
+      } catch (error) {
+        if (indexes.length === 1) {
+          batch[indexes[0]].reject(error);
+          continue;
+        }
+
+        // Rerun the group one caller at a time so a bad input only fails the
+        // caller that sent it
+        for (const requestIndex of indexes) {
+          try {
+            const [output] = this.runModel(modelType, [requests[requestIndex].patientData]);
+            batch[requestIndex].resolve(output);
+          } catch (itemError) {
+            batch[requestIndex].reject(itemError);
+          }
+        }
+      }
+    }
+  }
+
+  private runModel(
+    modelType: PredictionRequest['modelType'],
+    inputs: Record<string, any>[]
+  ): PredictionResult[] {
+    const model = this.models.get(modelType);
     if (!model) {
-      throw new Error(`Model ${request.modelType} not found`);
+      throw new Error(`Model ${modelType} not found`);
     }
 
     // Mock prediction logic
-    const mockPredictions = {
-      diagnosis: ['Diabetes Type 2', 'Hypertension', 'Cardiac Arrhythmia'],
-      risk: ['Low Risk', 'Medium Risk', 'High Risk'],
-      outcome: ['Good Prognosis', 'Fair Prognosis', 'Poor Prognosis'],
-    };
-
-    const predictions = mockPredictions[request.modelType];
-    const prediction = predictions[Math.floor(Math.random() * predictions.length)];
-    const confidence = Math.random() * 0.4 + 0.6; // 60-100%
-
-    return {
-      prediction,
-      confidence,
-      factors: ['Age', 'BMI', 'Blood Pressure', 'Family History'],
-      timestamp: new Date(),
-    };
+    const predictions = MOCK_PREDICTIONS[modelType];
+    const timestamp = new Date();
+
+    return inputs.map(() => ({
+      prediction: predictions[Math.floor(Math.random() * predictions.length)],
+      confidence: Math.random() * 0.4 + 0.6, // 60-100%
+      factors: MOCK_FACTORS,
+      timestamp,
+    }));
   }
 
   async cleanup(): Promise<void> {
     console.log('Cleaning up ML Pipeline...');
+    this.flushPredictions();
     this.models.clear();
     console.log('ML Pipeline cleanup complete');
   }
@@ -15,12 +15,12 @@ import { logger } from './utils/logger.js';
 import { MLPipeline } from './core/pipeline.js';
 import { setupRoutes } from './routes/index.js';
 import { MonitoringService } from './core/monitoring.js';
-import { DatabaseService } from './core/database.js';
+import { DatabaseService, type DatabaseClient } from './core/database.js';
 
 // Global services
 let mlPipeline: MLPipeline;
 let monitoringService: MonitoringService;
-let dbService: DatabaseService;
+let dbService: DatabaseClient;
 
 export async function createApp(): Promise<FastifyInstance> {
   const fastify = Fastify({
@@ -63,15 +63,15 @@ export async function createApp(): Promise<FastifyInstance> {
   );
 
   // Health check route
-  fastify.get('/health', async (request, reply) => {
-    const health = await monitoringService.getServiceHealth();
+  fastify.get<{ Querystring: { fresh?: string } }>('/health', async (request, reply) => {
+    const health = await monitoringService.getServiceHealth(request.query.fresh === 'true');
     return reply.status(health.status === 'healthy' ? 200 : 503).send(health);
   });
 
   // Metrics endpoint
   fastify.get('/metrics', async (request, reply) => {
     const metrics = await monitoringService.getMetrics();
-    return reply.type('text/plain').send(metrics);
+    return reply.type('text/plain; version=0.0.4').send(metrics);
   });
 
   // Decorate the Fastify instance so routes can access services as `fastify.mlPipeline`
@@ -85,6 +85,7 @@ export async function createApp(): Promise<FastifyInstance> {
   // Graceful shutdown
   fastify.addHook('onClose', async () => {
     logger.info('Shutting down ML service...');
+    monitoringService.stopSampling();
     await dbService.close();
     await mlPipeline.cleanup();
     logger.info('ML service shutdown complete');
@@ -100,9 +101,22 @@ async function start() {
 
     // Initialize services
     dbService = new DatabaseService(config.database);
-    await dbService.connect();
+    try {
+      await dbService.connect();
+    } catch (error) {
+      // Production must never run without its database
+      if (process.env.NODE_ENV === 'production') {
+        throw error;
+      }
+
+      // Fall back to in-src dev DB to allow local startup without Postgres;
+      // /health keeps reporting the database as down while it is in use
+      logger.error('Database connection failed, using in-memory dev fallback: ' + String(error));
+      const { createDevDatabaseService } = await import('./services/dev-database.js');
+      dbService = createDevDatabaseService();
+    }
 
-    monitoringService = new MonitoringService();
+    monitoringService = new MonitoringService(dbService);
     await monitoringService.initialize();
 
     mlPipeline = new MLPipeline(config.ml);
@@ -119,13 +133,7 @@ async function start() {
     logger.info(`Server running on ${config.server.host}:${config.server.port}`);
 
     // Start background monitoring
-    setInterval(async () => {
-      try {
-        await monitoringService.updateSystemMetrics();
-      } catch (error) {
-        logger.error('Error updating system metrics:', error);
-      }
-    }, 30000); // Every 30 seconds
+    monitoringService.startSampling();
   } catch (error) {
     logger.error('Failed to start server:', error);
     process.exit(1);
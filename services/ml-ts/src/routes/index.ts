@@ -9,91 +9,188 @@ interface PredictionRequest {
   modelType: 'diagnosis' | 'risk' | 'outcome';
 }
 
+// The model registry payload is constant, so serialize it once at load time
+// instead of running the JSON serializer on every request.
+const MODELS_RESPONSE = JSON.stringify({
+  models: [
+    { name: 'diagnosis', version: '1.0', status: 'active' },
+    { name: 'risk', version: '1.0', status: 'active' },
+    { name: 'outcome', version: '1.0', status: 'active' },
+  ],
+});
+
+// Response schemas let Fastify compile a dedicated serializer per route at
+// startup instead of running the generic JSON.stringify on every response.
+const predictionResultSchema = {
+  type: 'object',
+  properties: {
+    prediction: { type: 'string' },
+    confidence: { type: 'number' },
+    factors: { type: 'array', items: { type: 'string' } },
+    timestamp: { type: 'string', format: 'date-time' },
+  },
+};
+
+// Request bodies are checked by Fastify's compiled validator before the handler
+// runs; a failing body gets the framework's 400 response
+const patientDataSchema = { type: 'object' };
+
+const predictionRequestSchema = {
+  type: 'object',
+  required: ['patientData', 'modelType'],
+  properties: {
+    patientData: patientDataSchema,
+    modelType: { type: 'string', enum: ['diagnosis', 'risk', 'outcome'] },
+  },
+};
+
+const predictionEnvelopeSchema = {
+  type: 'object',
+  properties: {
+    success: { type: 'boolean' },
+    data: predictionResultSchema,
+  },
+};
+
+const batchPredictionRequestSchema = {
+  type: 'object',
+  required: ['requests'],
+  properties: {
+    requests: { type: 'array', minItems: 1, maxItems: 100, items: predictionRequestSchema },
+  },
+};
+
+const batchPredictionEnvelopeSchema = {
+  type: 'object',
+  properties: {
+    success: { type: 'boolean' },
+    data: { type: 'array', items: predictionResultSchema },
+  },
+};
+
 export async function setupRoutes(fastify: FastifyInstance): Promise<void> {
   // Use decorated services (declared in `src/types/fastify.d.ts`)
   const mlPipeline = fastify.mlPipeline;
   const monitoringService = fastify.monitoringService;
+
+  // One error path for every route instead of a try/catch per handler. Client
+  // errors keep Fastify's default payload; server errors answer with the route's
+  // configured message so internals never leak.
+  fastify.setErrorHandler((error, request, reply) => {
+    if (error.statusCode && error.statusCode < 500) {
+      return reply.send(error);
+    }
+
+    monitoringService?.incrementErrorCount?.();
+    const errorMessage = request.routeOptions.config.errorMessage ?? 'Internal server error';
+    fastify.log.error(`${errorMessage}: ${String(error)}`);
+    return reply.status(500).send({ error: errorMessage });
+  });
+
   // Predictions endpoint
-  fastify.post<{ Body: PredictionRequest }>('/api/v1/predictions', async (request, reply) => {
-    try {
+  fastify.post<{ Body: PredictionRequest }>(
+    '/api/v1/predictions',
+    {
+      schema: {
+        body: predictionRequestSchema,
+        response: { 200: predictionEnvelopeSchema },
+      },
+    },
+    async (request, reply) => {
       monitoringService?.incrementRequestCount?.();
 
       const { patientData, modelType } = request.body;
-
-      if (!patientData || !modelType) {
-        return reply.status(400).send({
-          error: 'Missing required fields: patientData, modelType',
-        });
-      }
-
       const result = await mlPipeline.predict({
         patientData,
         modelType,
       });
+      monitoringService?.incrementPredictionCount?.(modelType);
 
       return reply.send({
         success: true,
         data: result,
       });
-    } catch (error) {
-      monitoringService?.incrementErrorCount?.();
-      fastify.log.error('Prediction error: ' + String(error));
-      return reply.status(500).send({
-        error: 'Internal server error',
+    }
+  );
+
+  // Batch predictions; results are returned in request order
+  fastify.post<{ Body: { requests: PredictionRequest[] } }>(
+    '/api/v1/predictions/batch',
+    {
+      schema: {
+        body: batchPredictionRequestSchema,
+        response: { 200: batchPredictionEnvelopeSchema },
+      },
+    },
+    async (request, reply) => {
+      monitoringService?.incrementRequestCount?.();
+
+      const { requests } = request.body;
+      const results = await mlPipeline.predictBatch(requests);
+      for (const { modelType } of requests) {
+        monitoringService?.incrementPredictionCount?.(modelType);
+      }
+
+      return reply.send({
+        success: true,
+        data: results,
       });
     }
-  });
+  );
 
   // Diagnosis prediction
-  fastify.post('/api/v1/predict/diagnosis', async (request, reply) => {
-    try {
+  fastify.post(
+    '/api/v1/predict/diagnosis',
+    {
+      schema: { body: patientDataSchema, response: { 200: predictionResultSchema } },
+      config: { errorMessage: 'Prediction failed' },
+    },
+    async (request, reply) => {
       const result = await mlPipeline.predict({
         patientData: request.body as Record<string, unknown>,
         modelType: 'diagnosis',
       });
+      monitoringService?.incrementPredictionCount?.('diagnosis');
       return reply.send(result);
-    } catch (error) {
-      fastify.log.error('Diagnosis prediction error: ' + String(error));
-      return reply.status(500).send({ error: 'Prediction failed' });
     }
-  });
+  );
 
   // Risk assessment
-  fastify.post('/api/v1/predict/risk', async (request, reply) => {
-    try {
+  fastify.post(
+    '/api/v1/predict/risk',
+    {
+      schema: { body: patientDataSchema, response: { 200: predictionResultSchema } },
+      config: { errorMessage: 'Risk assessment failed' },
+    },
+    async (request, reply) => {
       const result = await mlPipeline.predict({
         patientData: request.body as Record<string, unknown>,
         modelType: 'risk',
       });
+      monitoringService?.incrementPredictionCount?.('risk');
       return reply.send(result);
-    } catch (error) {
-      fastify.log.error('Risk prediction error: ' + String(error));
-      return reply.status(500).send({ error: 'Risk assessment failed' });
     }
-  });
+  );
 
   // Outcome prediction
-  fastify.post('/api/v1/predict/outcome', async (request, reply) => {
-    try {
+  fastify.post(
+    '/api/v1/predict/outcome',
+    {
+      schema: { body: patientDataSchema, response: { 200: predictionResultSchema } },
+      config: { errorMessage: 'Outcome prediction failed' },
+    },
+    async (request, reply) => {
       const result = await mlPipeline.predict({
         patientData: request.body as Record<string, unknown>,
         modelType: 'outcome',
       });
+      monitoringService?.incrementPredictionCount?.('outcome');
       return reply.send(result);
-    } catch (error) {
-      fastify.log.error('Outcome prediction error: ' + String(error));
-      return reply.status(500).send({ error: 'Outcome prediction failed' });
     }
-  });
+  );
 
   // Model info
   fastify.get('/api/v1/models', async (request, reply) => {
-    return reply.send({
-      models: [
-        { name: 'diagnosis', version: '1.0', status: 'active' },
-        { name: 'risk', version: '1.0', status: 'active' },
-        { name: 'outcome', version: '1.0', status: 'active' },
-      ],
-    });
+    return reply.type('application/json').send(MODELS_RESPONSE);
   });
 }
@@ -1,14 +1,34 @@
+import type { DatabaseClient } from '../core/database.js';
+
 // Minimal in-src dev DB for ML service
-export class DevDatabaseService {
-  public isConnected = true;
+export class DevDatabaseService implements DatabaseClient {
+  private connected = true;
   private logs: Record<string, any[]> = {};
 
   async connect(): Promise<void> {
-    this.isConnected = true;
+    this.connected = true;
   }
 
   async disconnect(): Promise<void> {
-    this.isConnected = false;
+    this.connected = false;
+  }
+
+  async close(): Promise<void> {
+    await this.disconnect();
+  }
+
+  isConnected(): boolean {
+    return this.connected;
+  }
+
+  // There is no real database behind this fallback, so health checks must
+  // report it as down rather than healthy
+  async ping(): Promise<boolean> {
+    return false;
+  }
+
+  async query(): Promise<any[]> {
+    return [];
   }
 
   private pushLog(key: string, item: any) {
@@ -25,6 +45,6 @@ export class DevDatabaseService {
   }
 }
 
-export function createDevDatabaseService() {
+export function createDevDatabaseService(): DevDatabaseService {
   return new DevDatabaseService();
 }
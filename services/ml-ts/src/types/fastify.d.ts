@@ -7,6 +7,11 @@ declare module 'fastify' {
     dbService?: any;
   }
 
+  interface FastifyContextConfig {
+    // Body `error` text the shared error handler sends for 5xx failures
+    errorMessage?: string;
+  }
+
   interface FastifySchema {
     description?: string;
     tags?: string[];
@@ -18,8 +18,10 @@ export const logger = pino({
   },
 });
 
-// Structured logging helpers
+// Structured logging helpers. Each helper checks the level first so the
+// record object is only built when it will actually be emitted.
 export const logError = (message: string, error: Error, context?: any) => {
+  if (!logger.isLevelEnabled('error')) return;
   logger.error({
     message,
     error: {
@@ -32,13 +34,16 @@ export const logError = (message: string, error: Error, context?: any) => {
 };
 
 export const logInfo = (message: string, context?: any) => {
+  if (!logger.isLevelEnabled('info')) return;
   logger.info({ message, context });
 };
 
 export const logWarn = (message: string, context?: any) => {
+  if (!logger.isLevelEnabled('warn')) return;
   logger.warn({ message, context });
 };
 
 export const logDebug = (message: string, context?: any) => {
+  if (!logger.isLevelEnabled('debug')) return;
   logger.debug({ message, context });
 };
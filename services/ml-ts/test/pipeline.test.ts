@@ -0,0 +1,84 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+import { MLPipeline } from '../src/core/pipeline';
+
+async function createPipeline() {
+  const pipeline = new MLPipeline({ batchSize: 32 });
+  await pipeline.initialize();
+
+  // Echo each patient's id back so every caller can check it got its own result
+  const runModel = vi
+    .spyOn(pipeline as any, 'runModel')
+    .mockImplementation((_modelType: unknown, inputs: unknown) =>
+      (inputs as Record<string, any>[]).map((input) => {
+        if (input.invalid) {
+          throw new Error(`Invalid input for ${input.id}`);
+        }
+        return { prediction: input.id, confidence: 0.9, factors: [], timestamp: new Date() };
+      })
+    );
+
+  return { pipeline, runModel };
+}
+
+describe('MLPipeline.predict', () => {
+  beforeEach(() => {
+    vi.spyOn(console, 'log').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    vi.restoreAllMocks();
+  });
+
+  it('batches concurrent predictions into one model run with per-caller results', async () => {
+    const { pipeline, runModel } = await createPipeline();
+
+    const [first, second] = await Promise.all([
+      pipeline.predict({ modelType: 'diagnosis', patientData: { id: 'patient-1' } }),
+      pipeline.predict({ modelType: 'diagnosis', patientData: { id: 'patient-2' } }),
+    ]);
+
+    expect(runModel).toHaveBeenCalledTimes(1);
+    expect(runModel).toHaveBeenCalledWith('diagnosis', [{ id: 'patient-1' }, { id: 'patient-2' }]);
+    expect(first.prediction).toBe('patient-1');
+    expect(second.prediction).toBe('patient-2');
+  });
+
+  it('does not hold an idle request for the batch window', async () => {
+    vi.useFakeTimers({ toFake: ['setTimeout', 'clearTimeout'] });
+    const { pipeline } = await createPipeline();
+
+    // Resolves without advancing the fake clock, so no timer was waited on
+    const result = await pipeline.predict({
+      modelType: 'risk',
+      patientData: { id: 'patient-1' },
+    });
+
+    expect(result.prediction).toBe('patient-1');
+  });
+
+  it('rejects only the caller whose input fails', async () => {
+    const { pipeline } = await createPipeline();
+
+    const [bad, good] = await Promise.allSettled([
+      pipeline.predict({ modelType: 'outcome', patientData: { id: 'bad', invalid: true } }),
+      pipeline.predict({ modelType: 'outcome', patientData: { id: 'good' } }),
+    ]);
+
+    expect(bad.status).toBe('rejected');
+    expect((bad as PromiseRejectedResult).reason.message).toBe('Invalid input for bad');
+    expect(good.status).toBe('fulfilled');
+    expect((good as PromiseFulfilledResult<any>).value.prediction).toBe('good');
+  });
+
+  it('shares a read-only factor list between results', async () => {
+    const pipeline = new MLPipeline({ batchSize: 32 });
+    await pipeline.initialize();
+
+    const first = await pipeline.predict({ modelType: 'risk', patientData: {} });
+    expect(() => (first.factors as string[]).push('Smoking')).toThrow(TypeError);
+
+    const second = await pipeline.predict({ modelType: 'risk', patientData: {} });
+    expect(second.factors).toEqual(['Age', 'BMI', 'Blood Pressure', 'Family History']);
+  });
+});
@@ -0,0 +1,105 @@
+import Fastify, { type FastifyInstance } from 'fastify';
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+import { MLPipeline } from '../src/core/pipeline';
+import { setupRoutes } from '../src/routes/index';
+
+const MODEL_TYPES = ['diagnosis', 'risk', 'outcome'] as const;
+
+async function createTestApp(): Promise<FastifyInstance> {
+  const mlPipeline = new MLPipeline({ batchSize: 32 });
+  await mlPipeline.initialize();
+
+  // Predict each patient's id so response order can be checked against the request
+  vi.spyOn(mlPipeline as any, 'runModel').mockImplementation(
+    (_modelType: unknown, inputs: unknown) =>
+      (inputs as Record<string, any>[]).map((input) => ({
+        prediction: input.id,
+        confidence: 0.9,
+        factors: [],
+        timestamp: new Date(),
+      }))
+  );
+
+  const app = Fastify();
+  app.decorate('mlPipeline', mlPipeline);
+  app.decorate('monitoringService', {
+    incrementRequestCount: vi.fn(),
+    incrementPredictionCount: vi.fn(),
+    incrementErrorCount: vi.fn(),
+  });
+  await setupRoutes(app);
+  await app.ready();
+  return app;
+}
+
+function batchRequests(count: number) {
+  return Array.from({ length: count }, (_, i) => ({
+    modelType: MODEL_TYPES[i % MODEL_TYPES.length],
+    patientData: { id: `patient-${i}` },
+  }));
+}
+
+describe('POST /api/v1/predictions/batch', () => {
+  let app: FastifyInstance;
+
+  beforeEach(async () => {
+    vi.spyOn(console, 'log').mockImplementation(() => {});
+    app = await createTestApp();
+  });
+
+  afterEach(async () => {
+    await app.close();
+    vi.restoreAllMocks();
+  });
+
+  it('returns results in request order across model types', async () => {
+    const requests = batchRequests(7);
+
+    const res = await app.inject({
+      method: 'POST',
+      url: '/api/v1/predictions/batch',
+      payload: { requests },
+    });
+
+    expect(res.statusCode).toBe(200);
+    const body = res.json();
+    expect(body.success).toBe(true);
+    expect(body.data.map((result: { prediction: string }) => result.prediction)).toEqual(
+      requests.map(({ patientData }) => patientData.id)
+    );
+  });
+
+  it('accepts a batch of 100 requests', async () => {
+    const res = await app.inject({
+      method: 'POST',
+      url: '/api/v1/predictions/batch',
+      payload: { requests: batchRequests(100) },
+    });
+
+    expect(res.statusCode).toBe(200);
+    expect(res.json().data).toHaveLength(100);
+  });
+
+  it('rejects a batch larger than 100 requests', async () => {
+    const predictBatch = vi.spyOn(app.mlPipeline, 'predictBatch');
+
+    const res = await app.inject({
+      method: 'POST',
+      url: '/api/v1/predictions/batch',
+      payload: { requests: batchRequests(101) },
+    });
+
+    expect(res.statusCode).toBe(400);
+    expect(predictBatch).not.toHaveBeenCalled();
+  });
+
+  it('rejects an empty batch', async () => {
+    const res = await app.inject({
+      method: 'POST',
+      url: '/api/v1/predictions/batch',
+      payload: { requests: [] },
+    });
+
+    expect(res.statusCode).toBe(400);
+  });
+});
@@ -2,6 +2,7 @@
  * Alert Engine - Manages alerts and notifications
  */
 
+import { randomUUID } from 'crypto';
 import { logger } from '../utils/logger.js';
 import { config } from '../config/index.js';
 import type { NotificationService } from '../services/notification.service.js';
@@ -35,6 +36,21 @@ export class AlertEngine {
   private alertRules: Map<string, AlertRule> = new Map();
   private lastAlertTimes: Map<string, Date> = new Map();
   private isRunning = false;
+  // Running counters behind getAlertStats(), kept in step with `alerts` as
+  // alerts are created, resolved and cleaned up so stats never rescan the map
+  private resolvedCount = 0;
+  private severityCounts: Record<Alert['severity'], number> = {
+    low: 0,
+    medium: 0,
+    high: 0,
+    critical: 0,
+  };
+  private typeCounts: Record<Alert['type'], number> = {
+    system: 0,
+    patient: 0,
+    service: 0,
+    security: 0,
+  };
 
   constructor(private notificationService: NotificationService) {
     this.initializeDefaultRules();
@@ -100,6 +116,8 @@ export class AlertEngine {
 
     // Store alert
     this.alerts.set(alertId, alert);
+    this.severityCounts[alert.severity]++;
+    this.typeCounts[alert.type]++;
     this.lastAlertTimes.set(ruleKey, now);
 
     // Log alert
@@ -134,6 +152,7 @@ export class AlertEngine {
     alert.resolvedBy = resolvedBy;
 
     this.alerts.set(alertId, alert);
+    this.resolvedCount++;
 
     logger.info(`Alert resolved: ${alertId}`, {
       message: alert.message,
@@ -154,31 +173,23 @@ export class AlertEngine {
     since?: Date;
     limit?: number;
   }): Alert[] {
-    let alerts = Array.from(this.alerts.values());
+    // Alerts are stored in creation order, so walking the map backwards
+    // yields newest first without sorting the whole set on every call.
+    const stored = Array.from(this.alerts.values());
+    const alerts: Alert[] = [];
 
-    // Apply filters
-    if (filters?.type) {
-      alerts = alerts.filter((alert) => alert.type === filters.type);
-    }
+    for (let i = stored.length - 1; i >= 0; i--) {
+      const alert = stored[i];
 
-    if (filters?.severity) {
-      alerts = alerts.filter((alert) => alert.severity === filters.severity);
-    }
+      // Everything further back is older still
+      if (filters?.since && alert.timestamp < filters.since) break;
 
-    if (filters?.resolved !== undefined) {
-      alerts = alerts.filter((alert) => alert.resolved === filters.resolved);
-    }
+      if (filters?.type && alert.type !== filters.type) continue;
+      if (filters?.severity && alert.severity !== filters.severity) continue;
+      if (filters?.resolved !== undefined && alert.resolved !== filters.resolved) continue;
 
-    if (filters?.since) {
-      alerts = alerts.filter((alert) => alert.timestamp >= filters.since!);
-    }
-
-    // Sort by timestamp (newest first)
-    alerts.sort((a, b) => b.timestamp.getTime() - a.timestamp.getTime());
-
-    // Apply limit
-    if (filters?.limit) {
-      alerts = alerts.slice(0, filters.limit);
+      alerts.push(alert);
+      if (filters?.limit && alerts.length >= filters.limit) break;
     }
 
     return alerts;
@@ -199,32 +210,13 @@ export class AlertEngine {
     bySeverity: Record<Alert['severity'], number>;
     byType: Record<Alert['type'], number>;
   } {
-    const alerts = Array.from(this.alerts.values());
-
-    const stats = {
-      total: alerts.length,
-      active: alerts.filter((a) => !a.resolved).length,
-      resolved: alerts.filter((a) => a.resolved).length,
-      bySeverity: {
-        low: 0,
-        medium: 0,
-        high: 0,
-        critical: 0,
-      } as Record<Alert['severity'], number>,
-      byType: {
-        system: 0,
-        patient: 0,
-        service: 0,
-        security: 0,
-      } as Record<Alert['type'], number>,
+    return {
+      total: this.alerts.size,
+      active: this.alerts.size - this.resolvedCount,
+      resolved: this.resolvedCount,
+      bySeverity: { ...this.severityCounts },
+      byType: { ...this.typeCounts },
     };
-
-    alerts.forEach((alert) => {
-      stats.bySeverity[alert.severity]++;
-      stats.byType[alert.type]++;
-    });
-
-    return stats;
   }
 
   addRule(rule: AlertRule): void {
@@ -290,7 +282,7 @@ This alert was generated by the Nexus Saúde monitoring system.
   }
 
   private generateAlertId(): string {
-    return `alert_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+    return `alert_${randomUUID()}`;
   }
 
   private cleanupOldAlerts(): void {
@@ -302,6 +294,9 @@ This alert was generated by the Nexus Saúde monitoring system.
     for (const [alertId, alert] of this.alerts) {
       if (alert.timestamp < cutoffTime && alert.resolved) {
         this.alerts.delete(alertId);
+        this.resolvedCount--;
+        this.severityCounts[alert.severity]--;
+        this.typeCounts[alert.type]--;
         removedCount++;
       }
     }
@@ -5,6 +5,52 @@
 import { logger } from '../utils/logger.js';
 import { config } from '../config/index.js';
 
+// Static grid layout; built once rather than on every /config request
+const DEFAULT_LAYOUT = [
+  {
+    id: 'system-metrics',
+    x: 0,
+    y: 0,
+    w: 6,
+    h: 4,
+  },
+  {
+    id: 'patient-overview',
+    x: 6,
+    y: 0,
+    w: 6,
+    h: 2,
+  },
+  {
+    id: 'service-status',
+    x: 6,
+    y: 2,
+    w: 6,
+    h: 2,
+  },
+  {
+    id: 'alerts-summary',
+    x: 0,
+    y: 4,
+    w: 12,
+    h: 3,
+  },
+  {
+    id: 'recent-vitals',
+    x: 0,
+    y: 7,
+    w: 8,
+    h: 4,
+  },
+  {
+    id: 'performance-metrics',
+    x: 8,
+    y: 7,
+    w: 4,
+    h: 4,
+  },
+];
+
 export interface DashboardData {
   timestamp: Date;
   systemMetrics: {
@@ -81,17 +127,23 @@ export class DashboardManager {
 
   async updateDashboardData(): Promise<void> {
     try {
-      // In a real implementation, this would gather data from various services
-      const dashboardData: DashboardData = {
+      // In a real implementation, this would gather data from various services.
+      // The sources are independent, so gather them concurrently.
+      const [systemMetrics, patientMetrics, serviceStatus, alerts] = await Promise.all([
+        this.getSystemMetrics(),
+        this.getPatientMetrics(),
+        this.getServiceStatus(),
+        this.getAlertSummary(),
+      ]);
+
+      this.dashboardData = {
         timestamp: new Date(),
-        systemMetrics: await this.getSystemMetrics(),
-        patientMetrics: await this.getPatientMetrics(),
-        serviceStatus: await this.getServiceStatus(),
-        alerts: await this.getAlertSummary(),
+        systemMetrics,
+        patientMetrics,
+        serviceStatus,
+        alerts,
       };
 
-      this.dashboardData = dashboardData;
-
       // Update widgets with new data
       await this.updateWidgets();
 
@@ -145,7 +197,7 @@ export class DashboardManager {
     settings: any;
   }> {
     return {
-      layout: this.getDefaultLayout(),
+      layout: DEFAULT_LAYOUT,
       widgets: this.getAllWidgets(),
       settings: {
         refreshInterval: config.monitoring.intervals.metrics,
@@ -300,53 +352,6 @@ export class DashboardManager {
     defaultWidgets.forEach((widget) => this.addWidget(widget));
   }
 
-  private getDefaultLayout(): any[] {
-    return [
-      {
-        id: 'system-metrics',
-        x: 0,
-        y: 0,
-        w: 6,
-        h: 4,
-      },
-      {
-        id: 'patient-overview',
-        x: 6,
-        y: 0,
-        w: 6,
-        h: 2,
-      },
-      {
-        id: 'service-status',
-        x: 6,
-        y: 2,
-        w: 6,
-        h: 2,
-      },
-      {
-        id: 'alerts-summary',
-        x: 0,
-        y: 4,
-        w: 12,
-        h: 3,
-      },
-      {
-        id: 'recent-vitals',
-        x: 0,
-        y: 7,
-        w: 8,
-        h: 4,
-      },
-      {
-        id: 'performance-metrics',
-        x: 8,
-        y: 7,
-        w: 4,
-        h: 4,
-      },
-    ];
-  }
-
   // Export dashboard data for external use
   async exportDashboardData(format: 'json' | 'csv' = 'json'): Promise<string> {
     if (!this.dashboardData) {
@@ -6,6 +6,26 @@ import { logger } from '../utils/logger.js';
 import { config } from '../config/index.js';
 import type { SystemMetrics } from './system-monitor.js';
 
+// HELP text for the known system gauges, allocated once at module load
+const METRIC_HELP: Record<string, string> = {
+  system_cpu_usage_percent: 'Current CPU usage percentage',
+  system_cpu_cores: 'Number of CPU cores',
+  system_load_average_1m: 'System load average for 1 minute',
+  system_load_average_5m: 'System load average for 5 minutes',
+  system_load_average_15m: 'System load average for 15 minutes',
+  system_memory_total_bytes: 'Total system memory in bytes',
+  system_memory_free_bytes: 'Free system memory in bytes',
+  system_memory_used_bytes: 'Used system memory in bytes',
+  system_memory_usage_percent: 'Memory usage percentage',
+  system_disk_total_bytes: 'Total disk space in bytes',
+  system_disk_free_bytes: 'Free disk space in bytes',
+  system_disk_used_bytes: 'Used disk space in bytes',
+  system_disk_usage_percent: 'Disk usage percentage',
+  system_network_inbound_bytes: 'Network inbound bytes',
+  system_network_outbound_bytes: 'Network outbound bytes',
+  system_uptime_seconds: 'System uptime in seconds',
+};
+
 export interface MetricPoint {
   timestamp: Date;
   name: string;
@@ -24,6 +44,8 @@ export interface PrometheusMetric {
 export class MetricsCollector {
   private metrics: Map<string, MetricPoint[]> = new Map();
   private maxDataPoints = 10000;
+  // Rendered Prometheus exposition, reused until a metric changes
+  private prometheusCache: string | null = null;
 
   constructor() {
     logger.info('Initializing Metrics Collector');
@@ -80,6 +102,7 @@ export class MetricsCollector {
 
     const metricArray = this.metrics.get(name)!;
     metricArray.push(metricPoint);
+    this.prometheusCache = null;
 
     // Keep only the last maxDataPoints
     if (metricArray.length > this.maxDataPoints) {
@@ -88,9 +111,7 @@ export class MetricsCollector {
   }
 
   recordCounter(name: string, increment = 1, labels?: Record<string, string>): void {
-    const existing = this.getLatestMetric(name);
-    const newValue = (existing?.value || 0) + increment;
-    this.recordMetric(name, newValue, new Date(), labels);
+    this.incrementCounter(name, increment, new Date(), labels);
   }
 
   recordGauge(name: string, value: number, labels?: Record<string, string>): void {
@@ -103,14 +124,17 @@ export class MetricsCollector {
     buckets: number[],
     labels?: Record<string, string>
   ): void {
+    // One timestamp for the whole observation: sum, count and buckets share it
+    const timestamp = new Date();
+
     // Record the observation
-    this.recordMetric(`${name}_sum`, value, new Date(), labels);
-    this.recordCounter(`${name}_count`, 1, labels);
+    this.recordMetric(`${name}_sum`, value, timestamp, labels);
+    this.incrementCounter(`${name}_count`, 1, timestamp, labels);
 
     // Record bucket counts
     for (const bucket of buckets) {
       if (value <= bucket) {
-        this.recordCounter(`${name}_bucket`, 1, { ...labels, le: bucket.toString() });
+        this.incrementCounter(`${name}_bucket`, 1, timestamp, { ...labels, le: bucket.toString() });
       }
     }
   }
@@ -180,6 +204,10 @@ export class MetricsCollector {
   }
 
   async getPrometheusMetrics(): Promise<string> {
+    if (this.prometheusCache !== null) {
+      return this.prometheusCache;
+    }
+
     const lines: string[] = [];
     const metricNames = this.getAllMetricNames();
 
@@ -209,30 +237,23 @@ export class MetricsCollector {
       lines.push(''); // Empty line for readability
     }
 
-    return lines.join('\n');
+    this.prometheusCache = lines.join('\n');
+    return this.prometheusCache;
   }
 
-  private getMetricHelp(name: string): string {
-    const helpMap: Record<string, string> = {
-      system_cpu_usage_percent: 'Current CPU usage percentage',
-      system_cpu_cores: 'Number of CPU cores',
-      system_load_average_1m: 'System load average for 1 minute',
-      system_load_average_5m: 'System load average for 5 minutes',
-      system_load_average_15m: 'System load average for 15 minutes',
-      system_memory_total_bytes: 'Total system memory in bytes',
-      system_memory_free_bytes: 'Free system memory in bytes',
-      system_memory_used_bytes: 'Used system memory in bytes',
-      system_memory_usage_percent: 'Memory usage percentage',
-      system_disk_total_bytes: 'Total disk space in bytes',
-      system_disk_free_bytes: 'Free disk space in bytes',
-      system_disk_used_bytes: 'Used disk space in bytes',
-      system_disk_usage_percent: 'Disk usage percentage',
-      system_network_inbound_bytes: 'Network inbound bytes',
-      system_network_outbound_bytes: 'Network outbound bytes',
-      system_uptime_seconds: 'System uptime in seconds',
-    };
+  private incrementCounter(
+    name: string,
+    increment: number,
+    timestamp: Date,
+    labels?: Record<string, string>
+  ): void {
+    const existing = this.getLatestMetric(name);
+    const newValue = (existing?.value || 0) + increment;
+    this.recordMetric(name, newValue, timestamp, labels);
+  }
 
-    return helpMap[name] || `Metric: ${name}`;
+  private getMetricHelp(name: string): string {
+    return METRIC_HELP[name] || `Metric: ${name}`;
   }
 
   private getMetricType(name: string): string {
@@ -249,6 +270,7 @@ export class MetricsCollector {
 
   clearMetrics(): void {
     this.metrics.clear();
+    this.prometheusCache = null;
     logger.info('All metrics cleared');
   }
 
@@ -263,6 +285,7 @@ export class MetricsCollector {
       totalRemoved += metrics.length - filteredMetrics.length;
       this.metrics.set(name, filteredMetrics);
     }
+    this.prometheusCache = null;
 
     logger.info(`Cleared ${totalRemoved} old metric data points`);
   }
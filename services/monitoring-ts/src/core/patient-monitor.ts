@@ -127,6 +127,8 @@ export class PatientMonitor {
 
   private async checkVitalSignsThresholds(vitals: VitalSigns): Promise<void> {
     const alerts: PatientAlert[] = [];
+    // One timestamp for every alert raised from this reading
+    const now = new Date();
 
     // Heart rate checks
     if (vitals.heartRate) {
@@ -136,7 +138,7 @@ export class PatientMonitor {
           type: 'vitals',
           severity: vitals.heartRate < 50 || vitals.heartRate > 120 ? 'critical' : 'high',
           message: `Abnormal heart rate: ${vitals.heartRate} bpm`,
-          timestamp: new Date(),
+          timestamp: now,
           data: { heartRate: vitals.heartRate },
         });
       }
@@ -151,7 +153,7 @@ export class PatientMonitor {
           type: 'vitals',
           severity: systolic > 180 || diastolic > 110 ? 'critical' : 'high',
           message: `High blood pressure: ${systolic}/${diastolic} mmHg`,
-          timestamp: new Date(),
+          timestamp: now,
           data: { bloodPressure: vitals.bloodPressure },
         });
       }
@@ -165,7 +167,7 @@ export class PatientMonitor {
           type: 'vitals',
           severity: vitals.temperature > 39.5 || vitals.temperature < 35.0 ? 'critical' : 'medium',
           message: `Abnormal temperature: ${vitals.temperature}°C`,
-          timestamp: new Date(),
+          timestamp: now,
           data: { temperature: vitals.temperature },
         });
       }
@@ -179,7 +181,7 @@ export class PatientMonitor {
           type: 'vitals',
           severity: vitals.oxygenSaturation < 90 ? 'critical' : 'high',
           message: `Low oxygen saturation: ${vitals.oxygenSaturation}%`,
-          timestamp: new Date(),
+          timestamp: now,
           data: { oxygenSaturation: vitals.oxygenSaturation },
         });
       }
@@ -7,7 +7,6 @@ import * as fs from 'fs/promises';
 import { logger } from '../utils/logger.js';
 import { MetricsCollector } from './metrics-collector.js';
 import { AlertEngine } from './alert-engine';
-import type { Alert } from './alert-engine';
 import { config } from '../config/index.js';
 
 export interface SystemMetrics {
@@ -56,10 +55,89 @@ export interface ServiceStatus {
   errorMessage?: string;
 }
 
+// Health and status reads reuse a sample this fresh instead of re-reading
+// CPU, memory and disk on every probe
+const SNAPSHOT_TTL_MS = 2000;
+
+// /health, /status and the system routes all need the downstream service
+// probes; results this fresh are shared instead of re-fetching every service
+const SERVICES_TTL_MS = 5000;
+
+// The kernel only recomputes load averages every 5 seconds
+const LOAD_AVERAGE_TTL_MS = 5000;
+
+// Core count is fixed for the life of the process
+const CPU_CORES = os.cpus().length;
+
+interface ThresholdRule {
+  name: 'cpu' | 'memory' | 'disk';
+  label: string;
+  dataKey: string;
+  critical: number;
+  read: (metrics: SystemMetrics) => number;
+}
+
+// Resource checks in one table: warning limits come from config, critical
+// limits are fixed
+const THRESHOLD_RULES: readonly ThresholdRule[] = [
+  { name: 'cpu', label: 'CPU', dataKey: 'cpuUsage', critical: 95, read: (m) => m.cpu.usage },
+  {
+    name: 'memory',
+    label: 'memory',
+    dataKey: 'memoryUsage',
+    critical: 95,
+    read: (m) => m.memory.usagePercent,
+  },
+  {
+    name: 'disk',
+    label: 'disk',
+    dataKey: 'diskUsage',
+    critical: 98,
+    read: (m) => m.disk.usagePercent,
+  },
+];
+
+// Indexed by severity: 0 = healthy, 1 = warning, 2 = critical
+const HEALTH_LEVELS: readonly HealthStatus['status'][] = ['healthy', 'warning', 'critical'];
+const HEALTH_MESSAGES: readonly ((failedChecks: string) => string)[] = [
+  () => 'All systems operational',
+  (failedChecks) => `Warning: Issues detected in ${failedChecks}`,
+  (failedChecks) => `Critical issues detected: ${failedChecks}`,
+];
+
+interface CpuTimes {
+  idle: number;
+  total: number;
+}
+
+// Cumulative CPU ticks across all cores since boot
+function readCpuTimes(): CpuTimes {
+  let idle = 0;
+  let total = 0;
+
+  for (const cpu of os.cpus()) {
+    const { user, nice, sys, irq } = cpu.times;
+    idle += cpu.times.idle;
+    total += user + nice + sys + irq + cpu.times.idle;
+  }
+
+  return { idle, total };
+}
+
 export class SystemMonitor {
   private isRunning = false;
   private monitoringInterval?: NodeJS.Timeout;
   private lastNetworkStats: { [key: string]: number } = {};
+  private latestMetrics?: SystemMetrics;
+  private pendingMetrics?: Promise<SystemMetrics>;
+  private servicesSnapshot?: { expiresAt: number; statuses: Promise<ServiceStatus[]> };
+  private healthSnapshot?: { expiresAt: number; health: Promise<HealthStatus> };
+  // Baseline for the next CPU sample; taken at construction so the first
+  // reading already reflects recent load rather than the since-boot average
+  private lastCpuTimes: CpuTimes = readCpuTimes();
+  private lastCpuUsage = 0;
+  private loadAverage = os.loadavg();
+  private loadAverageAt = Date.now();
 
   constructor(
     private metricsCollector: MetricsCollector,
@@ -119,37 +197,67 @@ export class SystemMonitor {
     const diskInfo = await this.getDiskInfo();
     const networkInfo = await this.getNetworkInfo();
 
-    return {
+    const metrics: SystemMetrics = {
       timestamp: new Date(),
       cpu: {
         usage: cpuUsage,
-        cores: os.cpus().length,
-        loadAverage: os.loadavg(),
+        cores: CPU_CORES,
+        loadAverage: this.getLoadAverage(),
       },
       memory: memoryInfo,
       disk: diskInfo,
       network: networkInfo,
       uptime: os.uptime(),
     };
+
+    this.latestMetrics = metrics;
+    return metrics;
   }
 
-  private async getCpuUsage(): Promise<number> {
-    const cpus = os.cpus();
-    let totalIdle = 0;
-    let totalTick = 0;
+  /**
+   * Latest system metrics, re-collected only when the cached sample is older
+   * than SNAPSHOT_TTL_MS. Concurrent callers share a single collection.
+   */
+  async getMetricsSnapshot(): Promise<SystemMetrics> {
+    const latest = this.latestMetrics;
+    if (latest && Date.now() - latest.timestamp.getTime() < SNAPSHOT_TTL_MS) {
+      return latest;
+    }
 
-    cpus.forEach((cpu) => {
-      for (const type in cpu.times) {
-        totalTick += cpu.times[type as keyof typeof cpu.times];
-      }
-      totalIdle += cpu.times.idle;
-    });
+    if (!this.pendingMetrics) {
+      this.pendingMetrics = this.collectSystemMetrics().finally(() => {
+        this.pendingMetrics = undefined;
+      });
+    }
+    return this.pendingMetrics;
+  }
 
-    const idle = totalIdle / cpus.length;
-    const total = totalTick / cpus.length;
-    const usage = 100 - ~~((100 * idle) / total);
+  /**
+   * CPU usage over the interval since the previous sample, computed from the
+   * delta of cumulative tick counters. Never waits for a sampling window.
+   */
+  private async getCpuUsage(): Promise<number> {
+    const current = readCpuTimes();
+    const idle = current.idle - this.lastCpuTimes.idle;
+    const total = current.total - this.lastCpuTimes.total;
+
+    // Back-to-back samples can land within the same tick; keep the last value
+    if (total > 0) {
+      this.lastCpuTimes = current;
+      const usage = 100 - ~~((100 * idle) / total);
+      this.lastCpuUsage = Math.max(0, Math.min(100, usage));
+    }
 
-    return Math.max(0, Math.min(100, usage));
+    return this.lastCpuUsage;
+  }
+
+  private getLoadAverage(): number[] {
+    const now = Date.now();
+    if (now - this.loadAverageAt >= LOAD_AVERAGE_TTL_MS) {
+      this.loadAverage = os.loadavg();
+      this.loadAverageAt = now;
+    }
+    return this.loadAverage;
   }
 
   private getMemoryInfo(): SystemMetrics['memory'] {
@@ -201,85 +309,73 @@ export class SystemMonitor {
 
   private async checkThresholds(metrics: SystemMetrics): Promise<void> {
     const { thresholds } = config.monitoring;
-    const alerts: Array<Omit<Alert, 'id' | 'timestamp' | 'resolved'>> = [];
 
-    // CPU threshold check
-    if (metrics.cpu.usage > thresholds.cpu) {
-      alerts.push({
-        type: 'system',
-        severity: metrics.cpu.usage > 95 ? ('critical' as const) : ('high' as const),
-        message: `High CPU usage: ${metrics.cpu.usage.toFixed(1)}%`,
-        source: 'system-monitor',
-        data: { cpuUsage: metrics.cpu.usage, threshold: thresholds.cpu },
-      });
-    }
+    // Only readings over their limit get an alert built and formatted
+    for (const rule of THRESHOLD_RULES) {
+      const value = rule.read(metrics);
+      const threshold = thresholds[rule.name];
+      if (value <= threshold) continue;
 
-    // Memory threshold check
-    if (metrics.memory.usagePercent > thresholds.memory) {
-      alerts.push({
+      await this.alertEngine.sendAlert({
         type: 'system',
-        severity: metrics.memory.usagePercent > 95 ? ('critical' as const) : ('high' as const),
-        message: `High memory usage: ${metrics.memory.usagePercent.toFixed(1)}%`,
+        severity: value > rule.critical ? ('critical' as const) : ('high' as const),
+        message: `High ${rule.label} usage: ${value.toFixed(1)}%`,
         source: 'system-monitor',
-        data: { memoryUsage: metrics.memory.usagePercent, threshold: thresholds.memory },
+        data: { [rule.dataKey]: value, threshold },
       });
     }
+  }
 
-    // Disk threshold check
-    if (metrics.disk.usagePercent > thresholds.disk) {
-      alerts.push({
-        type: 'system',
-        severity: metrics.disk.usagePercent > 98 ? ('critical' as const) : ('high' as const),
-        message: `High disk usage: ${metrics.disk.usagePercent.toFixed(1)}%`,
-        source: 'system-monitor',
-        data: { diskUsage: metrics.disk.usagePercent, threshold: thresholds.disk },
-      });
+  /**
+   * Overall health, evaluated at most once per SNAPSHOT_TTL_MS. Probes inside
+   * the window get the same result, timestamp included, since none of its
+   * inputs can have changed.
+   */
+  getHealthStatus(): Promise<HealthStatus> {
+    const now = Date.now();
+    if (this.healthSnapshot && this.healthSnapshot.expiresAt > now) {
+      return this.healthSnapshot.health;
     }
 
-    // Send alerts
-    for (const alert of alerts) {
-      await this.alertEngine.sendAlert(alert);
-    }
+    const health = this.evaluateHealth();
+    this.healthSnapshot = { expiresAt: now + SNAPSHOT_TTL_MS, health };
+    return health;
   }
 
-  async getHealthStatus(): Promise<HealthStatus> {
+  private async evaluateHealth(): Promise<HealthStatus> {
     try {
-      const metrics = await this.collectSystemMetrics();
+      const [metrics, servicesHealthy] = await Promise.all([
+        this.getMetricsSnapshot(),
+        this.checkServicesHealth(),
+      ]);
       const { thresholds } = config.monitoring;
 
       const checks = {
         cpu: metrics.cpu.usage < thresholds.cpu,
         memory: metrics.memory.usagePercent < thresholds.memory,
         disk: metrics.disk.usagePercent < thresholds.disk,
-        services: await this.checkServicesHealth(),
+        services: servicesHealthy,
       };
 
-      const failedChecks = Object.entries(checks)
-        .filter(([_, passed]) => !passed)
-        .map(([check]) => check);
-
-      let status: 'healthy' | 'warning' | 'critical' = 'healthy';
-      let message = 'All systems operational';
-
-      if (failedChecks.length > 0) {
-        if (
-          metrics.cpu.usage > 95 ||
-          metrics.memory.usagePercent > 95 ||
-          metrics.disk.usagePercent > 98
-        ) {
-          status = 'critical';
-          message = `Critical issues detected: ${failedChecks.join(', ')}`;
-        } else {
-          status = 'warning';
-          message = `Warning: Issues detected in ${failedChecks.join(', ')}`;
+      // Every failed check raises the severity to at least a warning; a failed
+      // resource check past its critical limit raises it to critical
+      let severity = servicesHealthy ? 0 : 1;
+      for (const rule of THRESHOLD_RULES) {
+        if (!checks[rule.name]) {
+          severity = Math.max(severity, rule.read(metrics) > rule.critical ? 2 : 1);
         }
       }
 
+      const failedChecks = Object.entries(checks)
+        .filter(([_, passed]) => !passed)
+        .map(([check]) => check)
+        .join(', ');
+
       return {
-        status,
+        status: HEALTH_LEVELS[severity],
         timestamp: new Date(),
         checks,
-        message,
+        message: HEALTH_MESSAGES[severity](failedChecks),
       };
     } catch (error) {
       logger.error('Error getting health status', { error });
@@ -302,8 +398,10 @@ export class SystemMonitor {
     metrics: SystemMetrics;
     services: ServiceStatus[];
   }> {
-    const metrics = await this.collectSystemMetrics();
-    const services = await this.getServicesStatus();
+    const [metrics, services] = await Promise.all([
+      this.getMetricsSnapshot(),
+      this.getServicesStatus(),
+    ]);
 
     return {
       uptime: os.uptime(),
@@ -322,7 +420,18 @@ export class SystemMonitor {
     }
   }
 
-  private async getServicesStatus(): Promise<ServiceStatus[]> {
+  private getServicesStatus(): Promise<ServiceStatus[]> {
+    const now = Date.now();
+    if (this.servicesSnapshot && this.servicesSnapshot.expiresAt > now) {
+      return this.servicesSnapshot.statuses;
+    }
+
+    const statuses = this.probeServices();
+    this.servicesSnapshot = { expiresAt: now + SERVICES_TTL_MS, statuses };
+    return statuses;
+  }
+
+  private async probeServices(): Promise<ServiceStatus[]> {
     const services = [
       { name: 'fhir-service', url: 'http://localhost:3001/health' },
       { name: 'ai-service', url: 'http://localhost:3002/health' },
@@ -330,41 +439,44 @@ export class SystemMonitor {
       { name: 'nlp-service', url: 'http://localhost:3005/health' },
     ];
 
-    const serviceStatuses: ServiceStatus[] = [];
-
-    for (const service of services) {
-      try {
-        const controller = new AbortController();
-        const timeout = setTimeout(() => controller.abort(), 5000);
-
-        const startTime = Date.now();
-        const response = await fetch(service.url, {
-          method: 'GET',
-          headers: { Accept: 'application/json' },
-          signal: controller.signal,
-        });
-        clearTimeout(timeout);
-
-        const responseTime = Date.now() - startTime;
-
-        serviceStatuses.push({
-          name: service.name,
-          status: response.ok ? 'running' : 'error',
-          lastCheck: new Date(),
-          responseTime,
-          errorMessage: response.ok ? undefined : `HTTP ${response.status}`,
-        });
-      } catch (error) {
-        serviceStatuses.push({
-          name: service.name,
-          status: 'error',
-          lastCheck: new Date(),
-          errorMessage: String(error),
-        });
-      }
-    }
+    // Probe all services concurrently so the slowest one bounds the check; the
+    // whole round shares one check time
+    const lastCheck = new Date();
+    return Promise.all(
+      services.map((service) => this.probeService(service.name, service.url, lastCheck))
+    );
+  }
+
+  private async probeService(name: string, url: string, lastCheck: Date): Promise<ServiceStatus> {
+    try {
+      const controller = new AbortController();
+      const timeout = setTimeout(() => controller.abort(), 5000);
+
+      const startTime = Date.now();
+      const response = await fetch(url, {
+        method: 'GET',
+        headers: { Accept: 'application/json' },
+        signal: controller.signal,
+      });
+      clearTimeout(timeout);
 
-    return serviceStatuses;
+      const responseTime = Date.now() - startTime;
+
+      return {
+        name,
+        status: response.ok ? 'running' : 'error',
+        lastCheck,
+        responseTime,
+        errorMessage: response.ok ? undefined : `HTTP ${response.status}`,
+      };
+    } catch (error) {
+      return {
+        name,
+        status: 'error',
+        lastCheck,
+        errorMessage: String(error),
+      };
+    }
   }
 }
 
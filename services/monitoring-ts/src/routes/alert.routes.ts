@@ -3,24 +3,57 @@
  */
 
 import type { FastifyInstance } from 'fastify';
-import { logger } from '../utils/logger.js';
+import { handleErrors } from '../utils/handle-errors.js';
+
+// Fixed-shape stats envelope; the schema lets Fastify compile a serializer for it
+const alertStatsResponseSchema = {
+  type: 'object',
+  properties: {
+    success: { type: 'boolean' },
+    data: {
+      type: 'object',
+      properties: {
+        total: { type: 'integer' },
+        active: { type: 'integer' },
+        resolved: { type: 'integer' },
+        bySeverity: {
+          type: 'object',
+          properties: {
+            low: { type: 'integer' },
+            medium: { type: 'integer' },
+            high: { type: 'integer' },
+            critical: { type: 'integer' },
+          },
+        },
+        byType: {
+          type: 'object',
+          properties: {
+            system: { type: 'integer' },
+            patient: { type: 'integer' },
+            service: { type: 'integer' },
+            security: { type: 'integer' },
+          },
+        },
+      },
+    },
+  },
+};
 
 export async function alertRoutes(fastify: FastifyInstance): Promise<void> {
   // Get all alerts
-  fastify.get('/', async (request, reply) => {
-    try {
+  fastify.get(
+    '/',
+    handleErrors('get alerts', async (request, reply) => {
       const alertEngine = fastify.alertEngine;
       const alerts = alertEngine ? alertEngine.getAlerts() : [];
       return { success: true, data: alerts };
-    } catch (error) {
-      logger.error('Failed to get alerts', { error });
-      return reply.status(500).send({ success: false, error: 'Failed to get alerts' });
-    }
-  });
+    })
+  );
 
   // Get alert by ID
-  fastify.get('/:alertId', async (request, reply) => {
-    try {
+  fastify.get(
+    '/:alertId',
+    handleErrors('get alert', async (request, reply) => {
       const { alertId } = request.params as { alertId: string };
       const alertEngine = fastify.alertEngine;
       const alert = alertEngine ? alertEngine.getAlert(alertId) : null;
@@ -30,15 +63,13 @@ export async function alertRoutes(fastify: FastifyInstance): Promise<void> {
       }
 
       return { success: true, data: alert };
-    } catch (error) {
-      logger.error('Failed to get alert', { error });
-      return reply.status(500).send({ success: false, error: 'Failed to get alert' });
-    }
-  });
+    })
+  );
 
   // Resolve alert
-  fastify.patch('/:alertId/resolve', async (request, reply) => {
-    try {
+  fastify.patch(
+    '/:alertId/resolve',
+    handleErrors('resolve alert', async (request, reply) => {
       const { alertId } = request.params as { alertId: string };
       const { resolvedBy } = request.body as { resolvedBy?: string };
       const alertEngine = fastify.alertEngine;
@@ -52,23 +83,19 @@ export async function alertRoutes(fastify: FastifyInstance): Promise<void> {
       }
 
       return { success: true, message: 'Alert resolved successfully' };
-    } catch (error) {
-      logger.error('Failed to resolve alert', { error });
-      return reply.status(500).send({ success: false, error: 'Failed to resolve alert' });
-    }
-  });
+    })
+  );
 
   // Get alert statistics
-  fastify.get('/stats', async (request, reply) => {
-    try {
+  fastify.get(
+    '/stats',
+    { schema: { response: { 200: alertStatsResponseSchema } } },
+    handleErrors('get alert stats', async (request, reply) => {
       const alertEngine = fastify.alertEngine;
       const stats = alertEngine ? alertEngine.getAlertStats() : {};
       return { success: true, data: stats };
-    } catch (error) {
-      logger.error('Failed to get alert stats', { error });
-      return reply.status(500).send({ success: false, error: 'Failed to get alert stats' });
-    }
-  });
+    })
+  );
 }
 
 export default alertRoutes;
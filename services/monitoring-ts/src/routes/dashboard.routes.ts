@@ -3,57 +3,65 @@
  */
 
 import type { FastifyInstance } from 'fastify';
-import { logger } from '../utils/logger.js';
+import { handleErrors } from '../utils/handle-errors.js';
+import type { DashboardData } from '../core/dashboard-manager.js';
+
+// Serialized /data response, reused until the manager publishes a new snapshot.
+// Dashboards poll this far more often than the data refresh interval.
+let dataResponseCache: { snapshot: DashboardData; body: string } | null = null;
 
 export async function dashboardRoutes(fastify: FastifyInstance): Promise<void> {
   // Get dashboard data
-  fastify.get('/data', async (request, reply) => {
-    try {
+  fastify.get(
+    '/data',
+    handleErrors('get dashboard data', async (request, reply) => {
       const dashboardManager = fastify.dashboardManager;
       if (!dashboardManager || !dashboardManager.getDashboardData) {
         return reply.status(503).send({ success: false, error: 'Dashboard manager unavailable' });
       }
       const data = dashboardManager.getDashboardData();
-      return { success: true, data };
-    } catch (error) {
-      logger.error('Failed to get dashboard data', { error });
-      return reply.status(500).send({ success: false, error: 'Failed to get dashboard data' });
-    }
-  });
+      if (!data) {
+        return { success: true, data };
+      }
+
+      if (dataResponseCache?.snapshot !== data) {
+        dataResponseCache = { snapshot: data, body: JSON.stringify({ success: true, data }) };
+      }
+
+      return reply.type('application/json').send(dataResponseCache.body);
+    })
+  );
 
   // Get dashboard configuration
-  fastify.get('/config', async (request, reply) => {
-    try {
+  fastify.get(
+    '/config',
+    handleErrors('get dashboard config', async (request, reply) => {
       const dashboardManager = fastify.dashboardManager;
       if (!dashboardManager || !dashboardManager.getDashboardConfig) {
         return reply.status(503).send({ success: false, error: 'Dashboard manager unavailable' });
       }
       const config = await dashboardManager.getDashboardConfig();
       return { success: true, data: config };
-    } catch (error) {
-      logger.error('Failed to get dashboard config', { error });
-      return reply.status(500).send({ success: false, error: 'Failed to get dashboard config' });
-    }
-  });
+    })
+  );
 
   // Get all widgets
-  fastify.get('/widgets', async (request, reply) => {
-    try {
+  fastify.get(
+    '/widgets',
+    handleErrors('get widgets', async (request, reply) => {
       const dashboardManager = fastify.dashboardManager;
       if (!dashboardManager || !dashboardManager.getAllWidgets) {
         return reply.status(503).send({ success: false, error: 'Dashboard manager unavailable' });
       }
       const widgets = dashboardManager.getAllWidgets();
       return { success: true, data: widgets };
-    } catch (error) {
-      logger.error('Failed to get widgets', { error });
-      return reply.status(500).send({ success: false, error: 'Failed to get widgets' });
-    }
-  });
+    })
+  );
 
   // Get specific widget
-  fastify.get('/widgets/:widgetId', async (request, reply) => {
-    try {
+  fastify.get(
+    '/widgets/:widgetId',
+    handleErrors('get widget', async (request, reply) => {
       const { widgetId } = request.params as { widgetId: string };
       const dashboardManager = fastify.dashboardManager;
       if (!dashboardManager || !dashboardManager.getWidget) {
@@ -66,15 +74,13 @@ export async function dashboardRoutes(fastify: FastifyInstance): Promise<void> {
       }
 
       return { success: true, data: widget };
-    } catch (error) {
-      logger.error('Failed to get widget', { error });
-      return reply.status(500).send({ success: false, error: 'Failed to get widget' });
-    }
-  });
+    })
+  );
 
   // Export dashboard data
-  fastify.get('/export', async (request, reply) => {
-    try {
+  fastify.get(
+    '/export',
+    handleErrors('export dashboard data', async (request, reply) => {
       const { format = 'json' } = request.query as { format?: 'json' | 'csv' };
       const dashboardManager = fastify.dashboardManager;
       if (!dashboardManager || !dashboardManager.exportDashboardData) {
@@ -89,11 +95,8 @@ export async function dashboardRoutes(fastify: FastifyInstance): Promise<void> {
         .type(contentType)
         .header('Content-Disposition', `attachment; filename="${filename}"`)
         .send(exportData);
-    } catch (error) {
-      logger.error('Failed to export dashboard data', { error });
-      return reply.status(500).send({ success: false, error: 'Failed to export dashboard data' });
-    }
-  });
+    })
+  );
 }
 
 export default dashboardRoutes;
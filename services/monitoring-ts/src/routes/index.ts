@@ -9,6 +9,24 @@ import { dashboardRoutes } from './dashboard.routes.js';
 import { patientRoutes } from './patient.routes.js';
 import { websocketRoutes } from './websocket.routes.js';
 
+// Static service index, serialized once at load time
+const API_INDEX_RESPONSE = JSON.stringify({
+  service: 'Nexus Saúde Monitoring Service',
+  version: '1.0.0',
+  description: 'Real-time monitoring and alerting for healthcare platform',
+  endpoints: {
+    system: '/api/system',
+    alerts: '/api/alerts',
+    dashboard: '/api/dashboard',
+    patients: '/api/patients',
+    websocket: '/ws',
+    health: '/health',
+    metrics: '/metrics',
+    status: '/status',
+  },
+  documentation: 'https://docs.nexus-saude.com/monitoring',
+});
+
 export async function setupRoutes(fastify: FastifyInstance): Promise<void> {
   // Register route modules
   await fastify.register(systemRoutes, { prefix: '/api/system' });
@@ -19,22 +37,7 @@ export async function setupRoutes(fastify: FastifyInstance): Promise<void> {
 
   // API documentation endpoint
   fastify.get('/api', async (request, reply) => {
-    return {
-      service: 'Nexus Saúde Monitoring Service',
-      version: '1.0.0',
-      description: 'Real-time monitoring and alerting for healthcare platform',
-      endpoints: {
-        system: '/api/system',
-        alerts: '/api/alerts',
-        dashboard: '/api/dashboard',
-        patients: '/api/patients',
-        websocket: '/ws',
-        health: '/health',
-        metrics: '/metrics',
-        status: '/status',
-      },
-      documentation: 'https://docs.nexus-saude.com/monitoring',
-    };
+    return reply.type('application/json').send(API_INDEX_RESPONSE);
   });
 }
 
@@ -3,44 +3,107 @@
  */
 
 import type { FastifyInstance } from 'fastify';
-import { logger } from '../utils/logger.js';
+import { handleErrors } from '../utils/handle-errors.js';
+
+// Metrics and health are the scrape-heavy endpoints. Their schemas let Fastify
+// compile a serializer for them, and date-time fields encode Date values directly.
+const usageSchema = {
+  type: 'object',
+  properties: {
+    total: { type: 'number' },
+    free: { type: 'number' },
+    used: { type: 'number' },
+    usagePercent: { type: 'number' },
+  },
+};
+
+const metricsResponseSchema = {
+  type: 'object',
+  properties: {
+    success: { type: 'boolean' },
+    data: {
+      type: 'object',
+      properties: {
+        timestamp: { type: 'string', format: 'date-time' },
+        cpu: {
+          type: 'object',
+          properties: {
+            usage: { type: 'number' },
+            cores: { type: 'integer' },
+            loadAverage: { type: 'array', items: { type: 'number' } },
+          },
+        },
+        memory: usageSchema,
+        disk: usageSchema,
+        network: {
+          type: 'object',
+          properties: {
+            inbound: { type: 'number' },
+            outbound: { type: 'number' },
+          },
+        },
+        uptime: { type: 'number' },
+      },
+    },
+  },
+};
+
+const healthResponseSchema = {
+  type: 'object',
+  properties: {
+    success: { type: 'boolean' },
+    data: {
+      type: 'object',
+      properties: {
+        status: { type: 'string' },
+        timestamp: { type: 'string', format: 'date-time' },
+        checks: {
+          type: 'object',
+          properties: {
+            cpu: { type: 'boolean' },
+            memory: { type: 'boolean' },
+            disk: { type: 'boolean' },
+            services: { type: 'boolean' },
+          },
+        },
+        message: { type: 'string' },
+      },
+    },
+  },
+};
 
 export async function systemRoutes(fastify: FastifyInstance): Promise<void> {
   // Get system metrics
-  fastify.get('/metrics', async (request, reply) => {
-    try {
+  fastify.get(
+    '/metrics',
+    { schema: { response: { 200: metricsResponseSchema } } },
+    handleErrors('get system metrics', async (request, reply) => {
       const systemMonitor = fastify.systemMonitor;
-      const metrics = systemMonitor ? await systemMonitor.collectSystemMetrics() : {};
+      const metrics = systemMonitor ? await systemMonitor.getMetricsSnapshot() : {};
       return { success: true, data: metrics };
-    } catch (error) {
-      logger.error('Failed to get system metrics', { error });
-      return reply.status(500).send({ success: false, error: 'Failed to get system metrics' });
-    }
-  });
+    })
+  );
 
   // Get system status
-  fastify.get('/status', async (request, reply) => {
-    try {
+  fastify.get(
+    '/status',
+    handleErrors('get system status', async (request, reply) => {
       const systemMonitor = fastify.systemMonitor;
       const status = systemMonitor ? await systemMonitor.getSystemStatus() : {};
       return { success: true, data: status };
-    } catch (error) {
-      logger.error('Failed to get system status', { error });
-      return reply.status(500).send({ success: false, error: 'Failed to get system status' });
-    }
-  });
+    })
+  );
 
   // Get health status
-  fastify.get('/health', async (request, reply) => {
-    try {
+  fastify.get(
+    '/health',
+    { schema: { response: { 200: healthResponseSchema } } },
+    handleErrors('get health status', async (request, reply) => {
       const systemMonitor = fastify.systemMonitor;
       const health = systemMonitor ? await systemMonitor.getHealthStatus() : { status: 'unknown' };
       return { success: true, data: health };
-    } catch (error) {
-      logger.error('Failed to get health status', { error });
-      return reply.status(500).send({ success: false, error: 'Failed to get health status' });
-    }
-  });
+    })
+  );
 }
 
 export default systemRoutes;
@@ -2,6 +2,7 @@
  * Database Service - Handles database connections and operations for monitoring
  */
 
+import { randomUUID } from 'crypto';
 import { logger } from '../utils/logger.js';
 import { config } from '../config/index.js';
 
@@ -98,7 +99,7 @@ export class DatabaseService {
   }
 
   async saveMonitoringRecord(record: MonitoringRecord): Promise<string> {
-    const recordId = `record_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+    const recordId = `record_${randomUUID()}`;
     const recordWithId = { ...record, id: recordId };
 
     // Store in mock data
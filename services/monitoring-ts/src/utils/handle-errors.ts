@@ -0,0 +1,25 @@
+/**
+ * Shared error envelope for route handlers
+ */
+
+import type { FastifyReply, FastifyRequest } from 'fastify';
+import { logger } from './logger.js';
+
+type RouteHandler = (request: FastifyRequest, reply: FastifyReply) => Promise<unknown>;
+
+/**
+ * Wrap a route handler so any thrown error is logged and answered with
+ * 500 `{ success: false, error: 'Failed to <action>' }`.
+ */
+export function handleErrors(action: string, handler: RouteHandler): RouteHandler {
+  const message = `Failed to ${action}`;
+
+  return async (request, reply) => {
+    try {
+      return await handler(request, reply);
+    } catch (error) {
+      logger.error(message, { error });
+      return reply.status(500).send({ success: false, error: message });
+    }
+  };
+}
@@ -0,0 +1,95 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+import { AlertEngine, type Alert } from '../src/core/alert-engine';
+import type { NotificationService } from '../src/services/notification.service';
+
+function createEngine(): AlertEngine {
+  const notificationService = {
+    sendEmail: vi.fn().mockResolvedValue(undefined),
+    sendWebSocketMessage: vi.fn().mockResolvedValue(undefined),
+  } as unknown as NotificationService;
+  return new AlertEngine(notificationService);
+}
+
+// Distinct sources keep the default rule cooldowns from throttling the alerts
+function alert(
+  type: Alert['type'],
+  severity: Alert['severity'],
+  source: string
+): Omit<Alert, 'id' | 'timestamp' | 'resolved'> {
+  return { type, severity, source, message: `${type} ${severity} alert` };
+}
+
+describe('AlertEngine.getAlertStats', () => {
+  beforeEach(() => {
+    vi.spyOn(console, 'warn').mockImplementation(() => {});
+    vi.spyOn(console, 'info').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    vi.restoreAllMocks();
+  });
+
+  it('counts alerts by state, severity and type as they are sent and resolved', async () => {
+    const engine = createEngine();
+
+    const first = await engine.sendAlert(alert('system', 'high', 'cpu'));
+    await engine.sendAlert(alert('system', 'low', 'disk'));
+    await engine.sendAlert(alert('security', 'critical', 'auth'));
+    await engine.resolveAlert(first, 'on-call');
+
+    expect(engine.getAlertStats()).toEqual({
+      total: 3,
+      active: 2,
+      resolved: 1,
+      bySeverity: { low: 1, medium: 0, high: 1, critical: 1 },
+      byType: { system: 2, patient: 0, service: 0, security: 1 },
+    });
+  });
+
+  it('does not count an alert resolved twice', async () => {
+    const engine = createEngine();
+
+    const alertId = await engine.sendAlert(alert('service', 'medium', 'ml-ts'));
+    await engine.resolveAlert(alertId);
+    await engine.resolveAlert(alertId);
+
+    const stats = engine.getAlertStats();
+    expect(stats.active).toBe(0);
+    expect(stats.resolved).toBe(1);
+  });
+
+  it('drops cleaned up alerts from every counter', async () => {
+    vi.useFakeTimers({ toFake: ['Date'] });
+    vi.setSystemTime(new Date('2026-01-01T00:00:00Z'));
+    const engine = createEngine();
+
+    const old = await engine.sendAlert(alert('patient', 'critical', 'bed-1'));
+    await engine.sendAlert(alert('patient', 'high', 'bed-2'));
+    await engine.resolveAlert(old);
+
+    // Past the 90 day default alert retention
+    vi.setSystemTime(new Date('2026-06-01T00:00:00Z'));
+    (engine as any).cleanupOldAlerts();
+
+    expect(engine.getAlertStats()).toEqual({
+      total: 1,
+      active: 1,
+      resolved: 0,
+      bySeverity: { low: 0, medium: 0, high: 1, critical: 0 },
+      byType: { system: 0, patient: 1, service: 0, security: 0 },
+    });
+  });
+
+  it('returns copies that callers cannot use to change the counters', async () => {
+    const engine = createEngine();
+    await engine.sendAlert(alert('system', 'low', 'memory'));
+
+    const stats = engine.getAlertStats();
+    stats.bySeverity.low = 99;
+    stats.byType.system = 99;
+
+    expect(engine.getAlertStats().bySeverity.low).toBe(1);
+    expect(engine.getAlertStats().byType.system).toBe(1);
+  });
+});
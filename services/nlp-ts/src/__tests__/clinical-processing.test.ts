@@ -0,0 +1,100 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+import { ClinicalNLPProcessor } from '../core/clinical-nlp-processor';
+import { createTestApp } from './test-utils';
+
+const documents = [
+  { id: 'doc-1', text: 'Patient with fever and cough' },
+  { id: 'bad', text: 'Unreadable scan' },
+  { id: 'doc-2', text: 'Follow-up visit, stable' },
+];
+
+describe('ClinicalNLPProcessor.batchProcessDocuments', () => {
+  it('keeps the other results and reports the document that rejected', async () => {
+    const processor = new ClinicalNLPProcessor();
+    vi.spyOn(processor, 'processDocument').mockImplementation(async (_text, id) => {
+      if (id === 'bad') throw new Error('OCR text could not be parsed');
+      return { success: true, processingTime: 5 } as any;
+    });
+
+    const { results, failed } = await processor.batchProcessDocuments(documents);
+
+    expect([...results.keys()]).toEqual(['doc-1', 'doc-2']);
+    expect(failed).toEqual([{ id: 'bad', error: 'OCR text could not be parsed' }]);
+  });
+});
+
+describe('POST /api/v1/clinical-processing/batch', () => {
+  let app: any;
+  let recordClinicalProcessing: ReturnType<typeof vi.fn>;
+
+  function processed(id: string) {
+    return [
+      id,
+      {
+        documentType: 'progress_note',
+        overallQuality: 0.9,
+        stagesCompleted: ['entities', 'classification'],
+        entityExtraction: { entityCount: 3 },
+        processingTime: 5,
+      },
+    ] as [string, any];
+  }
+
+  beforeEach(async () => {
+    app = await createTestApp();
+    recordClinicalProcessing = vi.fn();
+    app.monitoringService.recordClinicalProcessing = recordClinicalProcessing;
+  });
+
+  afterEach(async () => {
+    if (app) await app.close();
+  });
+
+  it('reports documents that failed alongside the processed ones', async () => {
+    app.decorate('clinicalNLPProcessor', {
+      batchProcessDocuments: async () => ({
+        results: new Map([processed('doc-1'), processed('doc-2')]),
+        failed: [{ id: 'bad', error: 'OCR text could not be parsed' }],
+      }),
+    });
+
+    const res = await app.inject({
+      method: 'POST',
+      url: '/api/v1/clinical-processing/batch',
+      payload: { documents },
+    });
+
+    expect(res.statusCode).toBe(200);
+    const body = res.json();
+    expect(body.success).toBe(false);
+    expect(body.total_documents).toBe(3);
+    expect(body.processed_documents).toBe(2);
+    expect(body.failed_documents).toBe(1);
+    expect(body.failures).toEqual([{ document_id: 'bad', error: 'OCR text could not be parsed' }]);
+    expect(body.results.map((r: any) => r.document_id)).toEqual(['doc-1', 'doc-2']);
+    expect(body.batch_summary.average_quality_score).toBeCloseTo(0.9);
+    expect(body.batch_summary.processing_success_rate).toBeCloseTo(2 / 3);
+  });
+
+  it('reports a zero quality score when every document fails', async () => {
+    app.decorate('clinicalNLPProcessor', {
+      batchProcessDocuments: async () => ({
+        results: new Map(),
+        failed: documents.map(({ id }) => ({ id, error: 'timeout' })),
+      }),
+    });
+
+    const res = await app.inject({
+      method: 'POST',
+      url: '/api/v1/clinical-processing/batch',
+      payload: { documents },
+    });
+
+    const body = res.json();
+    expect(body.processed_documents).toBe(0);
+    expect(body.failed_documents).toBe(3);
+    expect(body.batch_summary.average_quality_score).toBe(0);
+    expect(body.batch_summary.processing_success_rate).toBe(0);
+    expect(recordClinicalProcessing).toHaveBeenCalledWith(0, 0);
+  });
+});
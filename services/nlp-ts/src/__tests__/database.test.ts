@@ -0,0 +1,184 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+import { DatabaseService, type DocumentClassificationLog } from '../core/database';
+
+// id + the seven document_classification_logs columns
+const CLASSIFICATION_ROW_WIDTH = 8;
+
+function createService(query = vi.fn().mockResolvedValue({ rows: [] })) {
+  const db = new DatabaseService();
+  const end = vi.fn().mockResolvedValue(undefined);
+  // Stand in for the pg pool so no Postgres is needed
+  (db as any).pool = { query, end };
+  return { db, query, end };
+}
+
+function classificationLog(documentId: string): DocumentClassificationLog {
+  return {
+    document_id: documentId,
+    document_type: 'clinical_note',
+    confidence: 0.9,
+    urgency_level: 'normal',
+    processing_priority: 1,
+    metadata: {},
+  };
+}
+
+function dbError(message: string, code: string): Error {
+  return Object.assign(new Error(message), { code });
+}
+
+function rowCount(call: unknown[]): number {
+  return (call[1] as unknown[]).length / CLASSIFICATION_ROW_WIDTH;
+}
+
+// Let rejected inserts run their error handling before asserting
+const settle = () => new Promise((resolve) => setImmediate(resolve));
+
+describe('DatabaseService log writer', () => {
+  beforeEach(() => {
+    vi.useFakeTimers({ toFake: ['setTimeout', 'clearTimeout'] });
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('flushes one multi-row insert once LOG_BATCH_MAX rows are queued', async () => {
+    const { db, query } = createService();
+
+    for (let i = 0; i < 99; i++) {
+      await db.logDocumentClassification(classificationLog(`doc-${i}`));
+    }
+    expect(query).not.toHaveBeenCalled();
+
+    await db.logDocumentClassification(classificationLog('doc-99'));
+    expect(query).toHaveBeenCalledTimes(1);
+    expect(query.mock.calls[0][0]).toMatch(/^INSERT INTO document_classification_logs/);
+    expect(rowCount(query.mock.calls[0])).toBe(100);
+  });
+
+  it('flushes a partial batch once the batch window elapses', async () => {
+    const { db, query } = createService();
+
+    await db.logDocumentClassification(classificationLog('doc-1'));
+    expect(query).not.toHaveBeenCalled();
+
+    vi.advanceTimersByTime(250);
+    expect(query).toHaveBeenCalledTimes(1);
+    expect(rowCount(query.mock.calls[0])).toBe(1);
+  });
+
+  it('retries a batch rejected for bad data row by row and drops only bad rows', async () => {
+    const query = vi
+      .fn()
+      .mockRejectedValueOnce(dbError('invalid input', '22P02'))
+      .mockRejectedValueOnce(dbError('duplicate key', '23505'))
+      .mockResolvedValue({ rows: [] });
+    const { db } = createService(query);
+
+    await db.logDocumentClassification(classificationLog('bad'));
+    await db.logDocumentClassification(classificationLog('good-1'));
+    await db.logDocumentClassification(classificationLog('good-2'));
+    await db.flushLogs();
+
+    // One batch insert, then one insert per row
+    expect(query).toHaveBeenCalledTimes(4);
+    expect(rowCount(query.mock.calls[0])).toBe(3);
+    expect(query.mock.calls.slice(1).map(rowCount)).toEqual([1, 1, 1]);
+
+    // The rejected row is not retried
+    await db.flushLogs();
+    expect(query).toHaveBeenCalledTimes(4);
+  });
+
+  it('requeues rows after a connection error and retries them on the next flush', async () => {
+    const query = vi
+      .fn()
+      .mockRejectedValueOnce(dbError('connection refused', 'ECONNREFUSED'))
+      .mockResolvedValue({ rows: [] });
+    const { db } = createService(query);
+
+    const ids = [
+      await db.logDocumentClassification(classificationLog('doc-1')),
+      await db.logDocumentClassification(classificationLog('doc-2')),
+    ];
+    await db.flushLogs();
+    await db.flushLogs();
+
+    expect(query).toHaveBeenCalledTimes(2);
+    const retried = query.mock.calls[1][1] as unknown[];
+    expect(retried[0]).toBe(ids[0]);
+    expect(retried[CLASSIFICATION_ROW_WIDTH]).toBe(ids[1]);
+  });
+
+  it('caps the requeued backlog while the database stays unreachable', async () => {
+    const query = vi.fn().mockRejectedValue(dbError('connection reset', 'ECONNRESET'));
+    const { db } = createService(query);
+
+    for (let i = 0; i < 1200; i++) {
+      await db.logDocumentClassification(classificationLog(`doc-${i}`));
+    }
+    await settle();
+
+    await db.flushLogs();
+    expect(rowCount(query.mock.calls.at(-1)!)).toBe(1000);
+  });
+
+  it('flushes queued rows before closing the pool on disconnect()', async () => {
+    const { db, query, end } = createService();
+
+    await db.logDocumentClassification(classificationLog('doc-1'));
+    await db.logDocumentClassification(classificationLog('doc-2'));
+    await db.disconnect();
+
+    expect(query).toHaveBeenCalledTimes(1);
+    expect(rowCount(query.mock.calls[0])).toBe(2);
+    expect(end).toHaveBeenCalledTimes(1);
+    expect(query.mock.invocationCallOrder[0]).toBeLessThan(end.mock.invocationCallOrder[0]);
+  });
+});
+
+describe('DatabaseService.getClassificationStats', () => {
+  it('builds every distribution from a single GROUPING SETS query', async () => {
+    // pg returns COUNT(*) and AVG() as strings and GROUPING() as an int
+    const query = vi.fn().mockResolvedValue({
+      rows: [
+        { document_type: 'clinical_note', grouping_id: 3, count: '4' },
+        { document_type: 'lab_report', grouping_id: 3, count: '2' },
+        { urgency_level: 'normal', grouping_id: 5, count: '5' },
+        { urgency_level: 'urgent', grouping_id: 5, count: '1' },
+        { specialty_area: 'cardiology', grouping_id: 6, count: '3' },
+        { specialty_area: null, grouping_id: 6, count: '3' },
+        { grouping_id: 7, count: '6', avg_confidence: '0.85' },
+      ],
+    });
+    const { db } = createService(query);
+
+    const stats = await db.getClassificationStats('week');
+
+    expect(query).toHaveBeenCalledTimes(1);
+    expect(query.mock.calls[0][0]).toMatch(/GROUPING SETS/);
+    expect(query.mock.calls[0][1]).toEqual(['1 week']);
+    expect(stats).toEqual({
+      total_classifications: 6,
+      document_type_distribution: { clinical_note: 4, lab_report: 2 },
+      urgency_distribution: { normal: 5, urgent: 1 },
+      specialty_distribution: { cardiology: 3 },
+      average_confidence: 0.85,
+    });
+  });
+
+  it('reports zeroes when there are no classifications in the timeframe', async () => {
+    const query = vi.fn().mockResolvedValue({
+      rows: [{ grouping_id: 7, count: '0', avg_confidence: null }],
+    });
+    const { db } = createService(query);
+
+    const stats = await db.getClassificationStats();
+
+    expect(query.mock.calls[0][1]).toEqual(['1 day']);
+    expect(stats.total_classifications).toBe(0);
+    expect(stats.average_confidence).toBe(0);
+    expect(stats.document_type_distribution).toEqual({});
+  });
+});
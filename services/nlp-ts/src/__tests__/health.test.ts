@@ -0,0 +1,23 @@
+import { afterAll, beforeAll, describe, expect, it } from 'vitest';
+import { createTestApp } from './test-utils';
+
+let app: any;
+
+beforeAll(async () => {
+  app = await createTestApp();
+});
+
+afterAll(async () => {
+  if (app) await app.close();
+});
+
+describe('Health routes', () => {
+  it('answers the liveness probe with its status and a timestamp', async () => {
+    const res = await app.inject({ method: 'GET', url: '/api/v1/health/live' });
+    expect(res.statusCode).toBe(200);
+    expect(res.headers['content-type']).toMatch(/^application\/json/);
+    const body = res.json();
+    expect(body.status).toBe('alive');
+    expect(new Date(body.timestamp).toISOString()).toBe(body.timestamp);
+  });
+});
@@ -0,0 +1,60 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+
+const START = new Date('2026-03-01T12:00:00.000Z');
+
+// Fresh module state (clock and sequence) for every test
+async function loadGenerator() {
+  vi.resetModules();
+  const { generateDocumentId } = await import('../utils/ids');
+  return generateDocumentId;
+}
+
+function clockOf(id: string): number {
+  return parseInt(id.slice(4, 15), 16);
+}
+
+describe('generateDocumentId', () => {
+  beforeEach(() => {
+    vi.useFakeTimers({ toFake: ['Date'] });
+    vi.setSystemTime(START);
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('builds fixed-width IDs that sort in creation order', async () => {
+    const generateDocumentId = await loadGenerator();
+
+    const ids = [generateDocumentId(), generateDocumentId()];
+    vi.setSystemTime(START.getTime() + 1);
+    ids.push(generateDocumentId());
+
+    expect(ids.every((id) => /^doc_[0-9a-f]{19}$/.test(id))).toBe(true);
+    expect(new Set(ids).size).toBe(3);
+    expect([...ids].sort()).toEqual(ids);
+    expect(clockOf(ids[0])).toBe(START.getTime());
+  });
+
+  it('moves to the next millisecond instead of wrapping the sequence', async () => {
+    const generateDocumentId = await loadGenerator();
+
+    const ids = Array.from({ length: 0x10001 }, () => generateDocumentId());
+
+    expect(new Set(ids).size).toBe(ids.length);
+    expect(ids.at(-2)!.endsWith('ffff')).toBe(true);
+    expect(clockOf(ids.at(-1)!)).toBe(START.getTime() + 1);
+    expect(ids.at(-1)! > ids.at(-2)!).toBe(true);
+  });
+
+  it('stays ordered when the wall clock steps back', async () => {
+    const generateDocumentId = await loadGenerator();
+
+    const before = generateDocumentId();
+    vi.setSystemTime(START.getTime() - 1000);
+    const after = generateDocumentId();
+
+    expect(after > before).toBe(true);
+    expect(clockOf(after)).toBe(START.getTime());
+  });
+});
@@ -21,8 +21,12 @@ export const config = {
     user: process.env.DB_USER || 'postgres',
     password: process.env.DB_PASSWORD || 'postgres',
     ssl: process.env.DB_SSL === 'true',
-    maxConnections: parseInt(process.env.DB_MAX_CONNECTIONS || '10', 10),
-    connectionTimeout: parseInt(process.env.DB_CONNECTION_TIMEOUT || '5000', 10)
+    // Sized for concurrent stats/health fan-out plus the log batch writer;
+    // connectionTimeout also bounds how long a request waits for a free client
+    maxConnections: parseInt(process.env.DB_MAX_CONNECTIONS || '20', 10),
+    connectionTimeout: parseInt(process.env.DB_CONNECTION_TIMEOUT || '5000', 10),
+    idleTimeout: parseInt(process.env.DB_IDLE_TIMEOUT_MS || '30000', 10), // ms
+    maxLifetime: parseInt(process.env.DB_MAX_LIFETIME_SECONDS || '1800', 10) // seconds
   },
 
   // Redis configuration
@@ -517,8 +517,9 @@ export class ClinicalNLPProcessor {
   async batchProcessDocuments(
     documents: Array<{ id: string; text: string }>,
     options: ProcessingOptions = {}
-  ): Promise<Map<string, ProcessingResult>> {
+  ): Promise<BatchProcessingResult> {
     const results = new Map<string, ProcessingResult>();
+    const failed: BatchProcessingFailure[] = [];
     const batchSize = config.processing.batchSize;
     
     logger.info(`Processing ${documents.length} documents in batches of ${batchSize}`);
@@ -526,21 +527,28 @@ export class ClinicalNLPProcessor {
     for (let i = 0; i < documents.length; i += batchSize) {
       const batch = documents.slice(i, i + batchSize);
       
-      const batchPromises = batch.map(doc => 
-        this.processDocument(doc.text, doc.id, options)
-          .then(result => ({ id: doc.id, result }))
+      // One failing document must not discard the rest of its batch
+      const batchResults = await Promise.allSettled(
+        batch.map(doc => this.processDocument(doc.text, doc.id, options))
       );
       
-      const batchResults = await Promise.all(batchPromises);
-      
-      batchResults.forEach(({ id, result }) => {
-        results.set(id, result);
+      batchResults.forEach((outcome, index) => {
+        const { id } = batch[index];
+        if (outcome.status === 'fulfilled') {
+          results.set(id, outcome.value);
+        } else {
+          logger.error(`Failed to process document ${id}:`, outcome.reason);
+          failed.push({
+            id,
+            error: outcome.reason instanceof Error ? outcome.reason.message : String(outcome.reason)
+          });
+        }
       });
       
       logger.debug(`Processed batch ${Math.floor(i / batchSize) + 1} of ${Math.ceil(documents.length / batchSize)}`);
     }
     
-    return results;
+    return { results, failed };
   }
 
   getProcessingResult(documentId: string): ProcessingResult | undefined {
@@ -572,4 +580,14 @@ export interface ProcessingOptions {
   extractStructuredData?: boolean;
   includeConfidenceScores?: boolean;
   enableNormalization?: boolean;
+}
+
+export interface BatchProcessingFailure {
+  id: string;
+  error: string;
+}
+
+export interface BatchProcessingResult {
+  results: Map<string, ProcessingResult>;
+  failed: BatchProcessingFailure[];
 }
\ No newline at end of file
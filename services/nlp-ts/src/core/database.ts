@@ -1,4 +1,5 @@
 import pg from 'pg';
+import { randomUUID } from 'crypto';
 import { logger } from '../utils/logger.js';
 import { config } from '../config/index.js';
 
@@ -75,6 +76,14 @@ export interface StructuredExtractionLog {
   created_at?: Date;
 }
 
+export interface ClassificationStats {
+  total_classifications: number;
+  document_type_distribution: Record<string, number>;
+  urgency_distribution: Record<string, number>;
+  specialty_distribution: Record<string, number>;
+  average_confidence: number;
+}
+
 export interface UsageStatistics {
   total_documents_processed: number;
   total_processing_time: number;
@@ -85,8 +94,32 @@ export interface UsageStatistics {
   monthly_usage: number;
 }
 
+// Background log writer: flush once this many rows are queued or after this
+// many milliseconds, whichever comes first.
+const LOG_BATCH_MAX = 100;
+const LOG_BATCH_MS = 250;
+const LOG_RETRY_LIMIT = 1000;
+
+// Named, so each pooled connection parses and plans the health probe once
+const PING_QUERY: pg.QueryConfig = { name: 'nlp_ping', text: 'SELECT 1' };
+
+// SQLSTATE classes 22 (data exception) and 23 (integrity constraint violation)
+// mean the rows themselves were rejected, not that the database is unavailable
+function isRowDataError(error: unknown): boolean {
+  const code = (error as { code?: unknown } | null)?.code;
+  return typeof code === 'string' && (code.startsWith('22') || code.startsWith('23'));
+}
+
+interface PendingLogBatch {
+  columns: readonly string[];
+  rows: unknown[][];
+}
+
 export class DatabaseService {
   private pool: pg.Pool | null = null;
+  private logQueue = new Map<string, PendingLogBatch>();
+  private queuedLogs: number = 0;
+  private flushTimer: NodeJS.Timeout | null = null;
   private connected: boolean = false;
   private reconnectAttempts: number = 0;
   private maxReconnectAttempts: number = 5;
@@ -108,11 +141,18 @@ export class DatabaseService {
         ssl: config.database.ssl,
         max: config.database.maxConnections,
         connectionTimeoutMillis: config.database.connectionTimeout,
-        idleTimeoutMillis: 30000,
+        idleTimeoutMillis: config.database.idleTimeout,
+        maxLifetimeSeconds: config.database.maxLifetime,
         query_timeout: 60000,
         statement_timeout: 60000
       });
 
+      // A backend dropping an idle client must not take the process down;
+      // the pool discards that client and opens a fresh one on demand
+      this.pool.on('error', (error) => {
+        logger.warn('Idle database client error:', error);
+      });
+
       // Test connection
       const client = await this.pool.connect();
       await client.query('SELECT NOW()');
@@ -222,6 +262,7 @@ export class DatabaseService {
       'CREATE INDEX IF NOT EXISTS idx_nlp_logs_created_at ON nlp_processing_logs(created_at)',
       'CREATE INDEX IF NOT EXISTS idx_classification_document_id ON document_classification_logs(document_id)',
       'CREATE INDEX IF NOT EXISTS idx_classification_type ON document_classification_logs(document_type)',
+      'CREATE INDEX IF NOT EXISTS idx_classification_created_at ON document_classification_logs(created_at)',
       'CREATE INDEX IF NOT EXISTS idx_entity_extraction_document_id ON entity_extraction_logs(document_id)',
       'CREATE INDEX IF NOT EXISTS idx_summarization_document_id ON summarization_logs(document_id)',
       'CREATE INDEX IF NOT EXISTS idx_structured_extraction_document_id ON structured_extraction_logs(document_id)'
@@ -239,17 +280,10 @@ export class DatabaseService {
   }
 
   async logNLPProcessing(log: NLPProcessingLog): Promise<string> {
-    if (!this.pool) throw new Error('Database not connected');
-
-    try {
-      const query = `
-        INSERT INTO nlp_processing_logs 
-        (document_id, processing_type, input_text_length, output_data, processing_time, confidence, status, error_message)
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-        RETURNING id
-      `;
-      
-      const values = [
+    return this.enqueueLog(
+      'nlp_processing_logs',
+      ['document_id', 'processing_type', 'input_text_length', 'output_data', 'processing_time', 'confidence', 'status', 'error_message'],
+      [
         log.document_id,
         log.processing_type,
         log.input_text_length,
@@ -258,28 +292,15 @@ export class DatabaseService {
         log.confidence,
         log.status,
         log.error_message
-      ];
-
-      const result = await this.pool.query(query, values);
-      return result.rows[0].id;
-    } catch (error) {
-      logger.error('Failed to log NLP processing:', error);
-      throw error;
-    }
+      ]
+    );
   }
 
   async logDocumentClassification(log: DocumentClassificationLog): Promise<string> {
-    if (!this.pool) throw new Error('Database not connected');
-
-    try {
-      const query = `
-        INSERT INTO document_classification_logs 
-        (document_id, document_type, confidence, urgency_level, specialty_area, processing_priority, metadata)
-        VALUES ($1, $2, $3, $4, $5, $6, $7)
-        RETURNING id
-      `;
-      
-      const values = [
+    return this.enqueueLog(
+      'document_classification_logs',
+      ['document_id', 'document_type', 'confidence', 'urgency_level', 'specialty_area', 'processing_priority', 'metadata'],
+      [
         log.document_id,
         log.document_type,
         log.confidence,
@@ -287,56 +308,30 @@ export class DatabaseService {
         log.specialty_area,
         log.processing_priority,
         JSON.stringify(log.metadata)
-      ];
-
-      const result = await this.pool.query(query, values);
-      return result.rows[0].id;
-    } catch (error) {
-      logger.error('Failed to log document classification:', error);
-      throw error;
-    }
+      ]
+    );
   }
 
   async logEntityExtraction(log: EntityExtractionLog): Promise<string> {
-    if (!this.pool) throw new Error('Database not connected');
-
-    try {
-      const query = `
-        INSERT INTO entity_extraction_logs 
-        (document_id, entities_count, entity_types, average_confidence, extraction_time, metadata)
-        VALUES ($1, $2, $3, $4, $5, $6)
-        RETURNING id
-      `;
-      
-      const values = [
+    return this.enqueueLog(
+      'entity_extraction_logs',
+      ['document_id', 'entities_count', 'entity_types', 'average_confidence', 'extraction_time', 'metadata'],
+      [
         log.document_id,
         log.entities_count,
         log.entity_types,
         log.average_confidence,
         log.extraction_time,
         JSON.stringify(log.metadata)
-      ];
-
-      const result = await this.pool.query(query, values);
-      return result.rows[0].id;
-    } catch (error) {
-      logger.error('Failed to log entity extraction:', error);
-      throw error;
-    }
+      ]
+    );
   }
 
   async logSummarization(log: SummarizationLog): Promise<string> {
-    if (!this.pool) throw new Error('Database not connected');
-
-    try {
-      const query = `
-        INSERT INTO summarization_logs 
-        (document_id, original_length, summary_length, compression_ratio, summary_type, confidence, key_points_count, processing_time)
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-        RETURNING id
-      `;
-      
-      const values = [
+    return this.enqueueLog(
+      'summarization_logs',
+      ['document_id', 'original_length', 'summary_length', 'compression_ratio', 'summary_type', 'confidence', 'key_points_count', 'processing_time'],
+      [
         log.document_id,
         log.original_length,
         log.summary_length,
@@ -345,107 +340,170 @@ export class DatabaseService {
         log.confidence,
         log.key_points_count,
         log.processing_time
-      ];
-
-      const result = await this.pool.query(query, values);
-      return result.rows[0].id;
-    } catch (error) {
-      logger.error('Failed to log summarization:', error);
-      throw error;
-    }
+      ]
+    );
   }
 
   async logStructuredExtraction(log: StructuredExtractionLog): Promise<string> {
-    if (!this.pool) throw new Error('Database not connected');
-
-    try {
-      const query = `
-        INSERT INTO structured_extraction_logs 
-        (document_id, fields_extracted, extraction_confidence, completeness_score, data_quality_score, processing_time)
-        VALUES ($1, $2, $3, $4, $5, $6)
-        RETURNING id
-      `;
-      
-      const values = [
+    return this.enqueueLog(
+      'structured_extraction_logs',
+      ['document_id', 'fields_extracted', 'extraction_confidence', 'completeness_score', 'data_quality_score', 'processing_time'],
+      [
         log.document_id,
         log.fields_extracted,
         log.extraction_confidence,
         log.completeness_score,
         log.data_quality_score,
         log.processing_time
-      ];
+      ]
+    );
+  }
+
+  /**
+   * Queue a log row for the background writer and return its id right away.
+   * Rows are flushed as one multi-row INSERT per table once LOG_BATCH_MAX rows
+   * are pending or LOG_BATCH_MS has elapsed, so request handlers never wait on
+   * a database round-trip for audit logging.
+   */
+  private enqueueLog(table: string, columns: readonly string[], values: unknown[]): string {
+    if (!this.pool) throw new Error('Database not connected');
 
-      const result = await this.pool.query(query, values);
-      return result.rows[0].id;
+    const id = randomUUID();
+    let batch = this.logQueue.get(table);
+    if (!batch) {
+      batch = { columns, rows: [] };
+      this.logQueue.set(table, batch);
+    }
+    batch.rows.push([id, ...values]);
+    this.queuedLogs++;
+
+    if (this.queuedLogs >= LOG_BATCH_MAX) {
+      void this.flushLogs();
+    } else {
+      this.scheduleLogFlush();
+    }
+
+    return id;
+  }
+
+  private scheduleLogFlush(): void {
+    if (this.flushTimer) return;
+    this.flushTimer = setTimeout(() => void this.flushLogs(), LOG_BATCH_MS);
+    this.flushTimer.unref();
+  }
+
+  async flushLogs(): Promise<void> {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+    if (this.queuedLogs === 0) return;
+
+    const batches = this.logQueue;
+    this.logQueue = new Map();
+    this.queuedLogs = 0;
+
+    await Promise.all(Array.from(batches, ([table, batch]) => this.insertLogBatch(table, batch)));
+  }
+
+  private async insertLogBatch(table: string, batch: PendingLogBatch): Promise<void> {
+    const width = batch.columns.length + 1;
+    const placeholders = batch.rows.map((_, row) => {
+      const offset = row * width;
+      return `(${Array.from({ length: width }, (_, col) => `$${offset + col + 1}`).join(', ')})`;
+    });
+
+    try {
+      if (!this.pool) throw new Error('Database not connected');
+      await this.pool.query(
+        `INSERT INTO ${table} (id, ${batch.columns.join(', ')}) VALUES ${placeholders.join(', ')}`,
+        batch.rows.flat()
+      );
     } catch (error) {
-      logger.error('Failed to log structured extraction:', error);
-      throw error;
+      if (isRowDataError(error)) {
+        // Retrying cannot fix bad data; isolate the offending rows so one of
+        // them does not take the rest of the batch down with it
+        if (batch.rows.length > 1) {
+          await Promise.all(
+            batch.rows.map((row) => this.insertLogBatch(table, { columns: batch.columns, rows: [row] }))
+          );
+        } else {
+          logger.error(`Dropping invalid ${table} row:`, error);
+        }
+        return;
+      }
+
+      logger.error(`Failed to flush ${batch.rows.length} ${table} rows:`, error);
+      this.requeueLogBatch(table, batch);
     }
   }
 
+  // Failed rows go back on the queue for the next flush. The backlog is capped
+  // per table so an unreachable database cannot grow memory without bound.
+  private requeueLogBatch(table: string, batch: PendingLogBatch): void {
+    const pending = this.logQueue.get(table);
+    const rows = pending ? batch.rows.concat(pending.rows) : batch.rows;
+    const kept = rows.slice(-LOG_RETRY_LIMIT);
+
+    if (kept.length < rows.length) {
+      logger.warn(`Dropping ${rows.length - kept.length} ${table} rows after failed flush`);
+    }
+
+    this.logQueue.set(table, { columns: batch.columns, rows: kept });
+    this.queuedLogs += kept.length - (pending ? pending.rows.length : 0);
+    this.scheduleLogFlush();
+  }
+
   async getUsageStatistics(days: number = 30): Promise<UsageStatistics> {
     if (!this.pool) throw new Error('Database not connected');
 
     try {
-      const queries = [
-        // Total documents processed
-        `SELECT COUNT(*) as total_count FROM nlp_processing_logs 
-         WHERE created_at >= NOW() - INTERVAL '${days} days'`,
-        
-        // Total and average processing time
-        `SELECT 
-           SUM(processing_time) as total_time,
-           AVG(processing_time) as avg_time
-         FROM nlp_processing_logs 
-         WHERE created_at >= NOW() - INTERVAL '${days} days'`,
-        
-        // Success rate
-        `SELECT 
-           COUNT(*) FILTER (WHERE status = 'success') * 100.0 / COUNT(*) as success_rate
-         FROM nlp_processing_logs 
-         WHERE created_at >= NOW() - INTERVAL '${days} days'`,
-        
-        // Most common document types
-        `SELECT document_type, COUNT(*) as count
-         FROM document_classification_logs 
-         WHERE created_at >= NOW() - INTERVAL '${days} days'
-         GROUP BY document_type 
-         ORDER BY count DESC 
-         LIMIT 5`,
-        
-        // Daily usage (today)
-        `SELECT COUNT(*) as daily_count
-         FROM nlp_processing_logs 
-         WHERE DATE(created_at) = CURRENT_DATE`,
-        
-        // Monthly usage (current month)
-        `SELECT COUNT(*) as monthly_count
-         FROM nlp_processing_logs 
-         WHERE EXTRACT(MONTH FROM created_at) = EXTRACT(MONTH FROM CURRENT_DATE)
-         AND EXTRACT(YEAR FROM created_at) = EXTRACT(YEAR FROM CURRENT_DATE)`
-      ];
-
-      const results = await Promise.all(
-        queries.map(query => this.pool!.query(query))
-      );
-
-      const [
-        totalResult,
-        timeResult,
-        successResult,
-        typesResult,
-        dailyResult,
-        monthlyResult
-      ] = results;
+      // Every nlp_processing_logs figure comes from one scan with FILTERed
+      // aggregates. The scan covers the requested window or the current month,
+      // whichever starts earlier, and runs alongside the type ranking query.
+      const [processingResult, typesResult] = await Promise.all([
+        this.pool.query(
+          `SELECT
+             COUNT(*) FILTER (WHERE created_at >= NOW() - $1::interval) as total_count,
+             SUM(processing_time) FILTER (WHERE created_at >= NOW() - $1::interval) as total_time,
+             AVG(processing_time) FILTER (WHERE created_at >= NOW() - $1::interval) as avg_time,
+             COUNT(*) FILTER (
+               WHERE created_at >= NOW() - $1::interval AND status = 'success'
+             ) * 100.0 / NULLIF(
+               COUNT(*) FILTER (WHERE created_at >= NOW() - $1::interval), 0
+             ) as success_rate,
+             COUNT(*) FILTER (
+               WHERE created_at >= CURRENT_DATE AND created_at < CURRENT_DATE + 1
+             ) as daily_count,
+             COUNT(*) FILTER (
+               WHERE created_at >= date_trunc('month', CURRENT_DATE)
+               AND created_at < date_trunc('month', CURRENT_DATE) + INTERVAL '1 month'
+             ) as monthly_count
+           FROM nlp_processing_logs
+           WHERE created_at >= LEAST(NOW() - $1::interval, date_trunc('month', CURRENT_DATE))`,
+          [`${days} days`]
+        ),
+        this.pool.query(
+          `SELECT document_type, COUNT(*) as count
+           FROM document_classification_logs 
+           WHERE created_at >= NOW() - $1::interval
+           GROUP BY document_type 
+           ORDER BY count DESC 
+           LIMIT 5`,
+          [`${days} days`]
+        )
+      ]);
+
+      const totals = processingResult.rows[0];
 
       return {
-        total_documents_processed: parseInt(totalResult.rows[0]?.total_count || '0'),
-        total_processing_time: parseInt(timeResult.rows[0]?.total_time || '0'),
-        average_processing_time: parseFloat(timeResult.rows[0]?.avg_time || '0'),
-        success_rate: parseFloat(successResult.rows[0]?.success_rate || '0'),
+        total_documents_processed: parseInt(totals?.total_count || '0'),
+        total_processing_time: parseInt(totals?.total_time || '0'),
+        average_processing_time: parseFloat(totals?.avg_time || '0'),
+        success_rate: parseFloat(totals?.success_rate || '0'),
         most_common_document_types: typesResult.rows.map((row: any) => row.document_type),
-        daily_usage: parseInt(dailyResult.rows[0]?.daily_count || '0'),
-        monthly_usage: parseInt(monthlyResult.rows[0]?.monthly_count || '0')
+        daily_usage: parseInt(totals?.daily_count || '0'),
+        monthly_usage: parseInt(totals?.monthly_count || '0')
       };
     } catch (error) {
       logger.error('Failed to get usage statistics:', error);
@@ -453,6 +511,67 @@ export class DatabaseService {
     }
   }
 
+  /**
+   * Classification counts and confidence for the given timeframe. Filtering
+   * and grouping run in Postgres as a single GROUPING SETS query, so only one
+   * row per distinct value comes back instead of every log row.
+   */
+  async getClassificationStats(timeframe: string = 'day'): Promise<ClassificationStats> {
+    if (!this.pool) throw new Error('Database not connected');
+
+    try {
+      const result = await this.pool.query(
+        `SELECT
+           document_type,
+           urgency_level,
+           specialty_area,
+           GROUPING(document_type, urgency_level, specialty_area) AS grouping_id,
+           COUNT(*) AS count,
+           AVG(confidence) AS avg_confidence
+         FROM document_classification_logs
+         WHERE created_at >= NOW() - $1::interval
+         GROUP BY GROUPING SETS ((document_type), (urgency_level), (specialty_area), ())`,
+        [`1 ${timeframe}`]
+      );
+
+      const stats: ClassificationStats = {
+        total_classifications: 0,
+        document_type_distribution: {},
+        urgency_distribution: {},
+        specialty_distribution: {},
+        average_confidence: 0
+      };
+
+      // grouping_id bits mark the rolled-up columns: 3 = by document_type,
+      // 5 = by urgency_level, 6 = by specialty_area, 7 = grand total
+      for (const row of result.rows) {
+        const count = parseInt(row.count, 10);
+        switch (row.grouping_id) {
+          case 3:
+            stats.document_type_distribution[row.document_type] = count;
+            break;
+          case 5:
+            stats.urgency_distribution[row.urgency_level] = count;
+            break;
+          case 6:
+            if (row.specialty_area !== null) {
+              stats.specialty_distribution[row.specialty_area] = count;
+            }
+            break;
+          case 7:
+            stats.total_classifications = count;
+            stats.average_confidence = parseFloat(row.avg_confidence || '0');
+            break;
+        }
+      }
+
+      return stats;
+    } catch (error) {
+      logger.error('Failed to get classification statistics:', error);
+      throw error;
+    }
+  }
+
   async getDocumentHistory(documentId: string): Promise<any[]> {
     if (!this.pool) throw new Error('Database not connected');
 
@@ -541,9 +660,7 @@ export class DatabaseService {
     if (!this.pool) return false;
 
     try {
-      const client = await this.pool.connect();
-      await client.query('SELECT 1');
-      client.release();
+      await this.pool.query(PING_QUERY);
       return true;
     } catch (error) {
       logger.error('Database connection test failed:', error);
@@ -570,6 +687,7 @@ export class DatabaseService {
   async disconnect(): Promise<void> {
     if (this.pool) {
       try {
+        await this.flushLogs();
         await this.pool.end();
         this.connected = false;
         logger.info('Database connection closed');
@@ -250,11 +250,9 @@ export class MedicalEntityExtractor {
       // Find entity relations
       const entityRelations = await this.findEntityRelations(text, contextualEntities);
       
-      // Calculate overall confidence
-      const confidence = this.calculateOverallConfidence(contextualEntities);
-      
-      // Generate metadata
+      // Generate metadata; its average confidence is the overall confidence
       const metadata = this.generateExtractionMetadata(contextualEntities);
+      const confidence = metadata.averageConfidence;
 
       const extractionTime = Date.now() - startTime;
 
@@ -482,23 +480,17 @@ export class MedicalEntityExtractor {
     return null;
   }
 
-  private calculateOverallConfidence(entities: MedicalEntity[]): number {
-    if (entities.length === 0) return 0;
-    
-    const avgConfidence = entities.reduce((sum, e) => sum + e.confidence, 0) / entities.length;
-    return Math.round(avgConfidence * 100) / 100;
-  }
-
   private generateExtractionMetadata(entities: MedicalEntity[]): ExtractionMetadata {
     const entityTypeDistribution: Record<string, number> = {};
+    let confidenceSum = 0;
     
-    entities.forEach(entity => {
+    // Label histogram and confidence total in one pass over the entities
+    for (const entity of entities) {
       entityTypeDistribution[entity.label] = (entityTypeDistribution[entity.label] || 0) + 1;
-    });
+      confidenceSum += entity.confidence;
+    }
 
-    const avgConfidence = entities.length > 0 
-      ? entities.reduce((sum, e) => sum + e.confidence, 0) / entities.length 
-      : 0;
+    const avgConfidence = entities.length > 0 ? confidenceSum / entities.length : 0;
 
     return {
       totalEntitiesFound: entities.length,
@@ -1,4 +1,5 @@
 import { FastifyInstance, FastifyReply, FastifyRequest } from 'fastify';
+import { generateDocumentId } from '../utils/ids.js';
 
 interface DocumentClassificationRequest {
   text: string;
@@ -168,7 +169,7 @@ export async function classificationRoutes(fastify: FastifyInstance) {
         }
 
         const startTime = Date.now();
-        const docId = document_id || `doc_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+        const docId = document_id || generateDocumentId();
 
         // Perform document classification
         const result = await documentClassifier.classifyDocument(text, docId);
@@ -1,4 +1,5 @@
 import { FastifyInstance, FastifyReply, FastifyRequest } from 'fastify';
+import { generateDocumentId } from '../utils/ids.js';
 
 interface ClinicalProcessingRequest {
   text: string;
@@ -222,7 +223,7 @@ export async function clinicalProcessingRoutes(fastify: FastifyInstance) {
         }
 
         const startTime = Date.now();
-        const docId = document_id || `doc_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+        const docId = document_id || generateDocumentId();
 
         // Perform comprehensive clinical processing
         const result = await clinicalNLPProcessor.processDocument(text, {
@@ -411,7 +412,19 @@ export async function clinicalProcessingRoutes(fastify: FastifyInstance) {
             properties: {
               success: { type: 'boolean' },
               total_documents: { type: 'number' },
+              processed_documents: { type: 'number' },
+              failed_documents: { type: 'number' },
               processing_time: { type: 'number' },
+              failures: {
+                type: 'array',
+                items: {
+                  type: 'object',
+                  properties: {
+                    document_id: { type: 'string' },
+                    error: { type: 'string' },
+                  },
+                },
+              },
               results: {
                 type: 'array',
                 items: {
@@ -466,7 +479,10 @@ export async function clinicalProcessingRoutes(fastify: FastifyInstance) {
           reply.code(500);
           return { error: 'Service Error', message: 'Clinical NLP processor not available' };
         }
-        const results = await clinicalNLPProcessor.batchProcessDocuments(documents, options);
+        const { results, failed } = await clinicalNLPProcessor.batchProcessDocuments(
+          documents,
+          options
+        );
 
         const processingTime = Date.now() - startTime;
 
@@ -519,28 +535,34 @@ export async function clinicalProcessingRoutes(fastify: FastifyInstance) {
           }
         }
 
+        // Averages cover the documents that were processed; a batch where every
+        // document failed has no quality score rather than NaN
+        const averageQualityScore =
+          processedResults.length > 0 ? totalQualityScore / processedResults.length : 0;
+
         // Record batch metrics
-        const resultsArray = Array.isArray(results)
-          ? results
-          : Array.from(results as Map<string, any>);
         if (monitoringService) {
-          monitoringService.recordRequest?.('clinical_processing_batch', processingTime, true);
-          monitoringService.recordClinicalProcessing?.(
-            totalProcessingStages,
-            totalQualityScore / resultsArray.length
+          monitoringService.recordRequest?.(
+            'clinical_processing_batch',
+            processingTime,
+            failed.length === 0
           );
+          monitoringService.recordClinicalProcessing?.(totalProcessingStages, averageQualityScore);
         }
 
         return {
-          success: true,
+          success: failed.length === 0,
           total_documents: documents.length,
+          processed_documents: processedResults.length,
+          failed_documents: failed.length,
           processing_time: processingTime,
+          failures: failed.map(({ id, error }) => ({ document_id: id, error })),
           results: processedResults,
           batch_summary: {
             total_entities_extracted: totalEntitiesExtracted,
-            average_quality_score:
-              resultsArray.length > 0 ? totalQualityScore / resultsArray.length : 0,
+            average_quality_score: averageQualityScore,
             document_type_distribution: documentTypeDistribution,
+            // Failed documents count against the rate, so it reflects the whole batch
             processing_success_rate:
               documents.length > 0 ? successfulProcessing / documents.length : 0,
             total_processing_stages: totalProcessingStages,
@@ -603,13 +625,14 @@ export async function clinicalProcessingRoutes(fastify: FastifyInstance) {
       }
 
       try {
-        const status = clinicalNLPProcessor.getProcessingStatus
-          ? await clinicalNLPProcessor.getProcessingStatus()
-          : { status: 'unknown', activeProcessors: [], queueLength: 0, capacity: {} };
-        const metrics =
+        const [status, metrics] = await Promise.all([
+          clinicalNLPProcessor.getProcessingStatus
+            ? clinicalNLPProcessor.getProcessingStatus()
+            : { status: 'unknown', activeProcessors: [], queueLength: 0, capacity: {} },
           monitoringService && monitoringService.getCurrentMetrics
-            ? await monitoringService.getCurrentMetrics()
-            : {};
+            ? monitoringService.getCurrentMetrics()
+            : {},
+        ]);
 
         return {
           pipeline_status: status.status,
@@ -1,4 +1,5 @@
 import { FastifyInstance, FastifyReply, FastifyRequest } from 'fastify';
+import { generateDocumentId } from '../utils/ids.js';
 
 interface MedicalEntity {
   text: string;
@@ -190,7 +191,7 @@ export async function entityRoutes(fastify: FastifyInstance) {
         }
 
         const startTime = Date.now();
-        const docId = document_id || `doc_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+        const docId = document_id || generateDocumentId();
 
         // Perform entity extraction
         const result = await entityExtractor.extractEntities(text, docId);
@@ -1,5 +1,9 @@
 import { FastifyInstance, FastifyReply, FastifyRequest } from 'fastify';
 
+// Liveness probes hit this every few seconds; only the timestamp changes, so
+// the body is assembled around a pre-encoded prefix instead of serialized
+const LIVENESS_RESPONSE_PREFIX = '{"status":"alive","timestamp":"';
+
 export async function healthRoutes(fastify: FastifyInstance) {
   // Advanced health check with detailed service status
   fastify.get(
@@ -89,8 +93,10 @@ export async function healthRoutes(fastify: FastifyInstance) {
           };
         }
 
-        const healthDetails = (await monitoringService?.getDetailedHealthStatus?.()) ?? {};
-        const performanceMetrics = (await monitoringService?.getPerformanceMetrics?.()) ?? {};
+        const [healthDetails = {}, performanceMetrics = {}] = await Promise.all([
+          monitoringService.getDetailedHealthStatus?.(),
+          monitoringService.getPerformanceMetrics?.(),
+        ]);
 
         return {
           status: 'healthy',
@@ -128,12 +134,14 @@ export async function healthRoutes(fastify: FastifyInstance) {
           },
         },
       },
+      // Orchestrator probes must never be throttled into a restart
+      config: { rateLimit: false },
     },
-    async () => {
-      return {
-        status: 'alive',
-        timestamp: new Date().toISOString(),
-      };
+    async (request: FastifyRequest, reply: FastifyReply) => {
+      // ISO timestamps contain nothing that needs JSON escaping
+      return reply
+        .type('application/json')
+        .send(`${LIVENESS_RESPONSE_PREFIX}${new Date().toISOString()}"}`);
     }
   );
 
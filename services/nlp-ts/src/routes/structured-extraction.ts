@@ -1,4 +1,5 @@
 import { FastifyInstance, FastifyReply, FastifyRequest } from 'fastify';
+import { generateDocumentId } from '../utils/ids.js';
 
 interface StructuredExtractionRequest {
   text: string;
@@ -305,7 +306,7 @@ export async function structuredExtractionRoutes(fastify: FastifyInstance) {
         }
 
         const startTime = Date.now();
-        const docId = document_id || `doc_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+        const docId = document_id || generateDocumentId();
 
         // Perform structured data extraction
         if (!structuredDataExtractor.extractStructuredData) {
@@ -1,4 +1,5 @@
 import { FastifyInstance, FastifyReply, FastifyRequest } from 'fastify';
+import { generateDocumentId } from '../utils/ids.js';
 
 interface SummarizationRequest {
   text: string;
@@ -180,7 +181,7 @@ export async function summarizationRoutes(fastify: FastifyInstance) {
         }
 
         const startTime = Date.now();
-        const docId = document_id || `doc_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+        const docId = document_id || generateDocumentId();
 
         // Perform summarization
         const result = await clinicalSummarizer.summarizeDocument(text, docId, options);
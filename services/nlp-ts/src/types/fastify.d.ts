@@ -31,7 +31,10 @@ declare module 'fastify' {
       batchProcessDocuments?: (
         docs: any[],
         opts?: any
-      ) => Promise<Map<string, any> | Array<[string, any]>>;
+      ) => Promise<{
+        results: Map<string, any> | Array<[string, any]>;
+        failed: Array<{ id: string; error: string }>;
+      }>;
       getProcessingStatus?: () => Promise<any>;
     };
 
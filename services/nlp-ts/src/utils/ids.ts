@@ -0,0 +1,35 @@
+/**
+ * Document IDs for requests that don't supply their own, laid out like a
+ * Snowflake ID: millisecond clock, worker id and a per-millisecond sequence,
+ * each as fixed-width hex so IDs sort by creation time.
+ *
+ * The worker id is drawn once per process rather than taken from the pid,
+ * which is the same (usually 1) in every container. The sequence allows
+ * 65,536 IDs per millisecond; when it runs out the ID borrows the next
+ * millisecond instead of wrapping, so IDs never repeat within a process and
+ * stay ordered even if the wall clock steps back.
+ */
+
+import { randomInt } from 'crypto';
+
+const WORKER_ID = randomInt(0x10000).toString(16).padStart(4, '0');
+const SEQUENCE_MAX = 0xffff;
+
+let lastMs = 0;
+let sequence = 0;
+
+export function generateDocumentId(): string {
+  const now = Date.now();
+  if (now > lastMs) {
+    lastMs = now;
+    sequence = 0;
+  } else if (sequence < SEQUENCE_MAX) {
+    sequence++;
+  } else {
+    lastMs++;
+    sequence = 0;
+  }
+
+  const clock = lastMs.toString(16).padStart(11, '0');
+  return `doc_${clock}${WORKER_ID}${sequence.toString(16).padStart(4, '0')}`;
+}